@@ -0,0 +1,37 @@
+from flask.cli import AppGroup
+import click
+from app import app, db
+from app.utils.DocumentNumbers import check_document_numbers, sync_document_numbers
+
+# flask --app run doc-numbers check|sync <Company_Code>
+doc_numbers_cli = AppGroup('doc-numbers', help='Compare the document number counters with the stored documents.')
+
+
+def _echo_behind(rows):
+    for row in rows:
+        scope = f"{row['TABLE_NAME']} company {row['Company_Code']} year {row['Year_Code']}"
+        if row['Tran_Type']:
+            scope += f" tran_type {row['Tran_Type']}"
+        click.echo(f"{scope}: counter {row['LAST_NO']} highest stored {row['STORED_MAX']}")
+
+
+@doc_numbers_cli.command('check')
+@click.argument('company_code', type=int)
+def check_document_numbers_command(company_code):
+    result = check_document_numbers(company_code)
+    _echo_behind(result['behind'])
+    click.echo(f"{result['checked']} counters checked, {len(result['behind'])} behind")
+    if result['behind']:
+        raise SystemExit(1)
+
+
+@doc_numbers_cli.command('sync')
+@click.argument('company_code', type=int)
+def sync_document_numbers_command(company_code):
+    result = sync_document_numbers(company_code)
+    db.session.commit()
+    _echo_behind(result['behind'])
+    click.echo(f"{result['checked']} counters checked, {len(result['behind'])} moved up")
+
+
+app.cli.add_command(doc_numbers_cli)
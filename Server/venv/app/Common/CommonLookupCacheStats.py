@@ -0,0 +1,12 @@
+from flask import jsonify
+from app import app
+from app.utils.LookupCache import lookup_cache_stats
+import os
+
+# Get the base URL from environment variables
+API_URL = os.getenv('API_URL')
+
+# Hit/miss counters of the master-data lookup caches
+@app.route(API_URL+"/lookup-cache-stats", methods=['GET'])
+def api_lookup_cache_stats():
+    return jsonify(lookup_cache_stats())
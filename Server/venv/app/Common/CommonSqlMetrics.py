@@ -0,0 +1,15 @@
+from flask import jsonify, request
+from app import app
+from app.utils.SqlMetrics import reset_sql_metrics, sql_metrics_stats
+import os
+
+# Get the base URL from environment variables
+API_URL = os.getenv('API_URL')
+
+# Queries, database time and latency per endpoint, plus the recent slow requests
+@app.route(API_URL+"/sql-metrics", methods=['GET'])
+def api_sql_metrics():
+    stats = sql_metrics_stats()
+    if request.args.get('reset', '').lower() in ('1', 'true', 'yes'):
+        reset_sql_metrics()
+    return jsonify(stats)
@@ -0,0 +1,395 @@
+# app/routes/group_routes.py
+from flask import jsonify, request
+from app import app, db
+from app.models.Reports.GLedeger.GLedgerModels import Gledger
+from app.utils.GLedgerPosting import post_gledger_entries, delete_gledger_entries, GLedgerPostingError
+from app.utils.GLedgerBalance import account_totals, debit_credit, rebuild_gledger_balances, verify_gledger_balances, ZERO
+from app.utils.ListQuery import LIST_CHUNK_SIZE, MAX_PAGE_SIZE, ListQueryError, decode_cursor, encode_cursor
+from app.models.Masters.AccountInformation.AccountMaster.AccountMasterModel import AccountMaster
+from app.models.Masters.AccountInformation.FinicialMasterModels import GroupMaster
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from flask import Response, current_app, stream_with_context
+from flask.cli import AppGroup
+from sqlalchemy import and_, func, or_, select
+import click
+import os
+# Get the base URL from environment variables
+API_URL = os.getenv('API_URL')
+
+def format_dates(task):
+    return {
+        "DOC_DATE": task.DOC_DATE.strftime('%Y-%m-%d') if task.DOC_DATE else None
+    }
+# Get all groups API
+# Get all groups API
+@app.route(API_URL+"/getall-Gledger", methods=["GET"])
+def get_GledgerallData():
+    try:
+        # Extract Company_Code from query parameters
+        Company_Code = request.args.get('Company_Code')
+        yearCode = request.args.get('Year_Code')
+        AC_CODE = request.args.get('AC_CODE')
+        if Company_Code is None:
+            return jsonify({'error': 'Missing Company_Code parameter'}), 400
+
+        try:
+            Company_Code = int(Company_Code)
+            yearCode = int(yearCode)
+            AC_CODE = int(AC_CODE)
+        except ValueError:
+            return jsonify({'error': 'Invalid Company_Code and Year Code and AC CODE parameter'}), 400
+
+        # Fetch records by Company_Code
+        records = Gledger.query.filter_by(COMPANY_CODE = Company_Code, YEAR_CODE = yearCode, AC_CODE = AC_CODE).order_by(Gledger.DOC_DATE,Gledger.TRAN_TYPE,Gledger.DOC_NO).all()
+
+        # Convert groups to a list of dictionaries
+        record_data = []
+        for record in records:
+            selected_Record_data = {column.key: getattr(record, column.key) for column in record.__table__.columns}
+            # Format dates and append to selected_Record_data
+            formatted_dates = format_dates(record)
+            selected_Record_data.update(formatted_dates)
+            record_data.append(selected_Record_data)
+
+        return jsonify(record_data)
+    except Exception as e:
+        print(e)
+        return jsonify({'error': 'internal server error'}), 500
+
+  
+# # Create a new group API
+@app.route(API_URL+"/create-Record-gLedger", methods=["POST"])
+def create_Record_Gledger():
+    try:
+        # Extract parameters from the request
+        company_code = request.args.get('Company_Code')
+        doc_no = request.args.get('DOC_NO')
+        year_code = request.args.get('Year_Code')
+        tran_type = request.args.get('TRAN_TYPE')
+        check_balance = request.args.get('Check_Balance', '').lower() in ('1', 'true', 'yes')
+        
+        # Check if required parameters are missing
+        if None in [company_code, doc_no, year_code, tran_type]:
+            return jsonify({'error': 'Missing parameters in the request'}), 400
+
+        new_records_data = request.json
+
+        # Check if the request body is a list
+        if not isinstance(new_records_data, list):
+            return jsonify({'error': 'Request body must be a list of records'}), 400
+
+        # Replace the document's rows in one transaction, writing only the changed rows
+        result = post_gledger_entries(company_code, doc_no, year_code, tran_type, new_records_data, check_balance=check_balance)
+        db.session.commit()
+
+        return jsonify({
+            'message': 'Records created successfully',
+            'records': new_records_data,
+            'posting': result
+        }), 201
+
+    except GLedgerPostingError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@app.route(API_URL + "/delete-Record-gLedger", methods=["DELETE"])
+def delete_Record_Gledger():
+    try:
+        # Extract parameters from the request
+        company_code = request.args.get('Company_Code')
+        doc_no = request.args.get('DOC_NO')
+        year_code = request.args.get('Year_Code')
+        tran_type = request.args.get('TRAN_TYPE')
+        
+        # Check if required parameters are missing
+        if None in [company_code, doc_no, year_code, tran_type]:
+            return jsonify({'error': 'Missing parameters in the request'}), 400
+        
+        # Convert parameters to appropriate types
+        try:
+            company_code = int(company_code)
+            doc_no = int(doc_no)
+            year_code = int(year_code)
+            tran_type = str(tran_type)
+        except ValueError:
+            return jsonify({'error': 'Invalid parameter type'}), 400
+
+        deleted_records_count = delete_gledger_entries(company_code, doc_no, year_code, tran_type)
+        db.session.commit()
+
+        return jsonify({
+            'message': 'Records deleted successfully',
+            'deleted_records_count': deleted_records_count
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
+
+
+gledger_table = Gledger.__table__
+LEDGER_TRAN_TYPE = func.coalesce(gledger_table.c.TRAN_TYPE, '')
+LEDGER_ORDER = (gledger_table.c.DOC_DATE, LEDGER_TRAN_TYPE, gledger_table.c.DOC_NO, gledger_table.c.GId)
+
+
+def parse_report_date(value, name):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        raise ListQueryError(f"Invalid {name}: {value!r}, expected YYYY-MM-DD")
+
+
+def ledger_after(cursor_key):
+    # Rows strictly after the cursor in (DOC_DATE, TRAN_TYPE, DOC_NO, GId) order
+    doc_date, tran_type, doc_no, gid = cursor_key
+    return or_(
+        gledger_table.c.DOC_DATE > doc_date,
+        and_(gledger_table.c.DOC_DATE == doc_date, or_(
+            LEDGER_TRAN_TYPE > tran_type,
+            and_(LEDGER_TRAN_TYPE == tran_type, or_(
+                gledger_table.c.DOC_NO > doc_no,
+                and_(gledger_table.c.DOC_NO == doc_no, gledger_table.c.GId > gid)
+            ))
+        ))
+    )
+
+
+class LedgerPages:
+    """Reads the ledger rows of one account in keyset pages, carrying the running balance."""
+
+    def __init__(self, statement, balance, limit, cursor_key):
+        self.statement = statement
+        self.balance = balance
+        self.limit = limit
+        self.cursor_key = cursor_key
+        self.next_cursor = None
+
+    def chunks(self):
+        remaining = self.limit
+        while remaining is None or remaining > 0:
+            size = LIST_CHUNK_SIZE if remaining is None else min(LIST_CHUNK_SIZE, remaining)
+            # One extra row on the last page of a limited read tells whether more rows follow
+            fetch = size + 1 if remaining is not None and remaining <= LIST_CHUNK_SIZE else size
+
+            page = self.statement
+            if self.cursor_key is not None:
+                page = page.where(ledger_after(self.cursor_key))
+            records = db.session.execute(page.order_by(*LEDGER_ORDER).limit(fetch)).mappings().all()
+
+            has_more = len(records) > size
+            records = records[:size]
+            rows = []
+            for record in records:
+                row = dict(record)
+                debit, credit = debit_credit(row['DRCR'], row['AMOUNT'])
+                self.balance += debit - credit
+                row['DOC_DATE'] = row['DOC_DATE'].strftime('%Y-%m-%d') if row['DOC_DATE'] else None
+                row['DEBIT'] = debit
+                row['CREDIT'] = credit
+                row['BALANCE'] = self.balance
+                rows.append(row)
+            if records:
+                last = records[-1]
+                self.cursor_key = (last['DOC_DATE'], last['TRAN_TYPE'] or '', last['DOC_NO'], last['GId'])
+                yield rows
+            if remaining is not None:
+                remaining -= len(records)
+                if has_more:
+                    doc_date, tran_type, doc_no, gid = self.cursor_key
+                    self.next_cursor = encode_cursor([doc_date.isoformat(), tran_type, doc_no, gid], self.balance)
+            if len(records) < size:
+                break
+
+
+@app.route(API_URL+"/gledger-ledger-report", methods=["GET"])
+def get_gledger_ledger_report():
+    """Ledger of one account between from_date and to_date with its opening and running balance.
+
+    Balances are debit minus credit. Accepts limit/cursor paging and format=ndjson.
+    """
+    try:
+        Company_Code = request.args.get('Company_Code')
+        yearCode = request.args.get('Year_Code')
+        AC_CODE = request.args.get('AC_CODE')
+        if None in [Company_Code, yearCode, AC_CODE]:
+            return jsonify({'error': 'Missing Company_Code, Year_Code or AC_CODE parameter'}), 400
+
+        try:
+            Company_Code = int(Company_Code)
+            yearCode = int(yearCode)
+            AC_CODE = int(AC_CODE)
+        except ValueError:
+            return jsonify({'error': 'Invalid Company_Code and Year Code and AC CODE parameter'}), 400
+
+        try:
+            from_date = parse_report_date(request.args.get('from_date'), 'from_date')
+            to_date = parse_report_date(request.args.get('to_date'), 'to_date')
+            limit = request.args.get('limit')
+            limit = min(int(limit), MAX_PAGE_SIZE) if limit else None
+            if limit is not None and limit < 1:
+                raise ListQueryError("limit must be positive")
+            output = request.args.get('format', 'json')
+            if output not in ('json', 'ndjson'):
+                raise ListQueryError(f"Unknown format {output!r}")
+            cursor_key = None
+            balance = None
+            if request.args.get('cursor'):
+                (doc_date, tran_type, doc_no, gid), balance = decode_cursor(request.args['cursor'])
+                cursor_key = (parse_report_date(doc_date, 'cursor'), tran_type, int(doc_no), int(gid))
+                balance = Decimal(balance)
+        except (ValueError, TypeError, InvalidOperation) as e:
+            return jsonify({"error": "Bad Request", "message": str(e)}), 400
+
+        # The opening balance comes from the month totals; on later pages the cursor carries it
+        debit, credit = account_totals(Company_Code, yearCode, from_date, [AC_CODE]).get(AC_CODE, (ZERO, ZERO))
+        opening_balance = debit - credit
+
+        statement = select(gledger_table).where(
+            gledger_table.c.COMPANY_CODE == Company_Code,
+            gledger_table.c.YEAR_CODE == yearCode,
+            gledger_table.c.AC_CODE == AC_CODE,
+            gledger_table.c.DOC_DATE >= from_date,
+            gledger_table.c.DOC_DATE <= to_date
+        )
+        pages = LedgerPages(statement, opening_balance if balance is None else balance, limit, cursor_key)
+
+        if output == 'ndjson':
+            dumps = current_app.json.dumps
+            # The first page is written out before the view returns, as in list_response()
+            chunks = pages.chunks()
+            first_lines = ''.join(dumps(row) + '\n' for row in next(chunks, []))
+
+            def ndjson_lines():
+                yield dumps({"opening_balance": opening_balance}) + '\n'
+                yield first_lines
+                for rows in chunks:
+                    yield ''.join(dumps(row) + '\n' for row in rows)
+                if pages.next_cursor:
+                    yield dumps({"next_cursor": pages.next_cursor}) + '\n'
+            return Response(stream_with_context(ndjson_lines()), mimetype='application/x-ndjson'), 200
+
+        rows = []
+        for chunk in pages.chunks():
+            rows.extend(chunk)
+        response = {
+            "opening_balance": opening_balance,
+            "closing_balance": pages.balance,
+            "rows": rows
+        }
+        if limit is not None:
+            response["next_cursor"] = pages.next_cursor
+        return jsonify(response), 200
+
+    except Exception as e:
+        print(e)
+        return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
+
+
+@app.route(API_URL+"/gledger-trial-balance", methods=["GET"])
+def get_gledger_trial_balance():
+    """Debit, credit and balance per account and per group up to to_date (the whole year without it)."""
+    try:
+        Company_Code = request.args.get('Company_Code')
+        yearCode = request.args.get('Year_Code')
+        if None in [Company_Code, yearCode]:
+            return jsonify({'error': 'Missing Company_Code or Year_Code parameter'}), 400
+
+        try:
+            Company_Code = int(Company_Code)
+            yearCode = int(yearCode)
+            to_date = request.args.get('to_date')
+            to_date = parse_report_date(to_date, 'to_date') if to_date else None
+        except ValueError as e:
+            return jsonify({'error': 'Bad Request', 'message': str(e)}), 400
+
+        totals = account_totals(Company_Code, yearCode, to_date + timedelta(days=1) if to_date else None)
+
+        accounts = {
+            row.Ac_Code: row for row in db.session.execute(
+                select(AccountMaster.Ac_Code, AccountMaster.Ac_Name_E, AccountMaster.Group_Code)
+                .where(AccountMaster.company_code == Company_Code)
+            ).all()
+        }
+        groups = {
+            row.group_Code: row for row in db.session.execute(
+                select(GroupMaster.group_Code, GroupMaster.group_Name_E, GroupMaster.group_Type)
+                .where(GroupMaster.Company_Code == Company_Code)
+            ).all()
+        }
+
+        account_rows = []
+        group_rows = {}
+        total_debit = ZERO
+        total_credit = ZERO
+        for ac_code in sorted(totals):
+            debit, credit = totals[ac_code]
+            account = accounts.get(ac_code)
+            group_code = account.Group_Code if account else None
+            account_rows.append({
+                "AC_CODE": ac_code,
+                "Ac_Name_E": account.Ac_Name_E if account else None,
+                "Group_Code": group_code,
+                "DEBIT": debit,
+                "CREDIT": credit,
+                "BALANCE": debit - credit
+            })
+            group = groups.get(group_code)
+            group_row = group_rows.setdefault(group_code, {
+                "group_Code": group_code,
+                "group_Name_E": group.group_Name_E if group else None,
+                "group_Type": group.group_Type if group else None,
+                "DEBIT": ZERO,
+                "CREDIT": ZERO,
+                "accounts": 0
+            })
+            group_row["DEBIT"] += debit
+            group_row["CREDIT"] += credit
+            group_row["accounts"] += 1
+            total_debit += debit
+            total_credit += credit
+
+        for group_row in group_rows.values():
+            group_row["BALANCE"] = group_row["DEBIT"] - group_row["CREDIT"]
+
+        return jsonify({
+            "accounts": account_rows,
+            "groups": sorted(group_rows.values(), key=lambda row: (row["group_Code"] is None, row["group_Code"] or 0)),
+            "totals": {"DEBIT": total_debit, "CREDIT": total_credit, "BALANCE": total_debit - total_credit}
+        }), 200
+
+    except Exception as e:
+        print(e)
+        return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
+
+
+# flask --app run gledger-balance verify|rebuild <Company_Code> [--year <Year_Code>]
+gledger_balance_cli = AppGroup('gledger-balance', help='Check or rebuild the GLedger account month totals.')
+
+
+@gledger_balance_cli.command('verify')
+@click.argument('company_code', type=int)
+@click.option('--year', 'year_code', type=int, default=None, help='Only this Year_Code.')
+def verify_gledger_balance_command(company_code, year_code):
+    result = verify_gledger_balances(company_code, year_code)
+    for difference in result['differences']:
+        click.echo(f"AC_CODE {difference['AC_CODE']} year {difference['YEAR_CODE']} month {difference['BALANCE_MONTH']}: "
+                   f"expected {difference['expected']} stored {difference['stored']}")
+    click.echo(f"{result['months']} account months checked, {len(result['differences'])} differ")
+    if result['differences']:
+        raise SystemExit(1)
+
+
+@gledger_balance_cli.command('rebuild')
+@click.argument('company_code', type=int)
+@click.option('--year', 'year_code', type=int, default=None, help='Only this Year_Code.')
+def rebuild_gledger_balance_command(company_code, year_code):
+    result = rebuild_gledger_balances(company_code, year_code)
+    db.session.commit()
+    click.echo(f"{result['months']} account months, {result['deleted']} month rows removed, {result['inserted']} written")
+
+
+app.cli.add_command(gledger_balance_cli)
@@ -0,0 +1,547 @@
+from flask import Flask, jsonify, request
+from app import app, db
+from app.models.Transactions.ReceiptPayment.ReceiptPaymentModels import ReceiptPaymentHead, ReceiptPaymentDetail
+from app.models.Transactions.ReceiptPayment.ReceiptPaymentSchema import ReceiptPaymentHeadSchema, ReceiptPaymentDetailSchema
+from app.utils.CommonGLedgerFunctions import fetch_company_parameters, get_accoid, getSaleAc, get_acShort_Name
+from app.utils.GLedgerPosting import post_gledger_entries, delete_gledger_entries
+from app.utils.ListQuery import list_response, lookup_rows
+from app.utils.DocumentNumbers import DocumentSeries
+from app.utils.DetailSync import DetailSync
+from sqlalchemy import text, func, select
+from sqlalchemy.exc import SQLAlchemyError
+import os
+
+API_URL = os.getenv('API_URL')
+
+receipt_payment_numbers = DocumentSeries(ReceiptPaymentHead.doc_no, ReceiptPaymentHead.company_code, ReceiptPaymentHead.year_code, ReceiptPaymentHead.tran_type)
+receipt_payment_details = DetailSync(ReceiptPaymentDetail, 'trandetailid', update_exclude=('tranid',))
+
+RECEIPT_PAYMENT_DETAILS_QUERY = '''
+SELECT         
+    cashbank.Ac_Name_E AS cashbankname,  
+    debitac.Ac_Name_E AS debitacname,  
+    creditac.Ac_Name_E AS creditacname, 
+    unit.Ac_Name_E AS unitacname,  
+    adjustedac.Ac_Name_E AS adjustedacname
+FROM
+    dbo.nt_1_accountmaster AS creditac 
+    RIGHT OUTER JOIN dbo.nt_1_accountmaster AS unit 
+    RIGHT OUTER JOIN dbo.nt_1_accountmaster AS adjustedac 
+    RIGHT OUTER JOIN dbo.nt_1_transactdetail 
+    ON adjustedac.accoid = dbo.nt_1_transactdetail.ac 
+    ON unit.accoid = dbo.nt_1_transactdetail.uc 
+    ON creditac.accoid = dbo.nt_1_transactdetail.ca 
+    LEFT OUTER JOIN dbo.nt_1_accountmaster AS debitac 
+    ON dbo.nt_1_transactdetail.da = debitac.accoid 
+    RIGHT OUTER JOIN dbo.nt_1_transacthead 
+    LEFT OUTER JOIN dbo.nt_1_accountmaster AS cashbank 
+    ON dbo.nt_1_transacthead.cb = cashbank.accoid 
+    ON dbo.nt_1_transactdetail.tranid = dbo.nt_1_transacthead.tranid
+WHERE 
+    dbo.nt_1_transacthead.tranid = :tranid
+'''
+
+# The labels of a chunk of the receipt/payment list
+RECEIPT_PAYMENT_LIST_LABELS_QUERY = '''
+SELECT         
+    dbo.nt_1_transacthead.tranid AS lookup_key,
+    cashbank.Ac_Name_E AS cashbankname,  
+    debitac.Ac_Name_E AS debitacname,  
+    creditac.Ac_Name_E AS creditacname, 
+    unit.Ac_Name_E AS unitacname,  
+    adjustedac.Ac_Name_E AS adjustedacname
+FROM
+    dbo.nt_1_accountmaster AS creditac 
+    RIGHT OUTER JOIN dbo.nt_1_accountmaster AS unit 
+    RIGHT OUTER JOIN dbo.nt_1_accountmaster AS adjustedac 
+    RIGHT OUTER JOIN dbo.nt_1_transactdetail 
+    ON adjustedac.accoid = dbo.nt_1_transactdetail.ac 
+    ON unit.accoid = dbo.nt_1_transactdetail.uc 
+    ON creditac.accoid = dbo.nt_1_transactdetail.ca 
+    LEFT OUTER JOIN dbo.nt_1_accountmaster AS debitac 
+    ON dbo.nt_1_transactdetail.da = debitac.accoid 
+    RIGHT OUTER JOIN dbo.nt_1_transacthead 
+    LEFT OUTER JOIN dbo.nt_1_accountmaster AS cashbank 
+    ON dbo.nt_1_transacthead.cb = cashbank.accoid 
+    ON dbo.nt_1_transactdetail.tranid = dbo.nt_1_transacthead.tranid
+WHERE 
+    dbo.nt_1_transacthead.tranid IN :keys
+'''
+
+receipt_payment_head_schema = ReceiptPaymentHeadSchema()
+receipt_payment_head_schemas = ReceiptPaymentHeadSchema(many=True)
+
+receipt_payment_detail_schema = ReceiptPaymentDetailSchema()
+receipt_payment_detail_schemas = ReceiptPaymentDetailSchema(many=True)
+
+def format_dates(task):
+    return {
+        "doc_date": task.doc_date.strftime('%Y-%m-%d') if task.doc_date else None,
+    }
+
+# Get data from both tables ReceiptPaymentHead and ReceiptPaymentDetail
+@app.route(API_URL + "/getdata-receiptpayment", methods=["GET"])
+def getdata_receiptpayment():
+    try:
+        Company_Code = request.args.get('Company_Code')
+        Year_Code = request.args.get('Year_Code')
+        tran_type = request.args.get('tran_type')
+        if not all([Company_Code, Year_Code, tran_type]):
+            return jsonify({"error": "Missing required parameters"}), 400
+
+        records = select(ReceiptPaymentHead).filter_by(company_code=Company_Code, year_code=Year_Code,tran_type = tran_type)
+
+        def record_labels(records):
+            return lookup_rows(RECEIPT_PAYMENT_LIST_LABELS_QUERY, [record.tranid for record in records])
+
+        def record_response(record, chunk_labels):
+            receipt_payment_head_data = {column.name: getattr(record, column.name) for column in record.__table__.columns}
+            receipt_payment_head_data.update(format_dates(record))
+
+            labels = chunk_labels.get(record.tranid, [])
+
+            
+            detail_data = [{
+                **{column.name: getattr(detail, column.name) for column in detail.__table__.columns},
+                **format_dates(detail)
+            } for detail in record.details]
+
+            return {
+                "receipt_payment_head_data": receipt_payment_head_data,
+                "labels": labels,
+                "receipt_payment_details": detail_data
+            }
+
+        return list_response(records, {}, key='tranid', convert=record_response, envelope="all_data_receiptpayment",
+                             not_found="No records found", preload=('details',), lookups=record_labels)
+
+    except Exception as e:
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
+
+# Get data by the particular doc_no
+@app.route(API_URL + "/getreceiptpaymentByid", methods=["GET"])
+def getreceiptpaymentByid():
+    try:
+        Company_Code = request.args.get('Company_Code')
+        doc_no = request.args.get('doc_no')
+        Year_Code = request.args.get('Year_Code')
+        tran_type = request.args.get('tran_type')
+        if not all([Company_Code, Year_Code, tran_type, doc_no]):
+            return jsonify({"error": "Missing required parameters"}), 400
+
+        receipt_payment_head = ReceiptPaymentHead.query.filter_by(doc_no=doc_no, company_code=Company_Code, year_code=Year_Code, tran_type=tran_type).first()
+        if not receipt_payment_head:
+            return jsonify({"error": "No records found"}), 404
+
+        tranid = receipt_payment_head.tranid
+        additional_data = db.session.execute(text(RECEIPT_PAYMENT_DETAILS_QUERY), {"tranid": tranid})
+        additional_data_rows = additional_data.fetchall()
+
+        labels = [dict(row._mapping) for row in additional_data_rows]
+
+        response = {
+            "receipt_payment_head": {
+                **{column.name: getattr(receipt_payment_head, column.name) for column in receipt_payment_head.__table__.columns},
+                **format_dates(receipt_payment_head)
+            },
+            "labels": labels,
+            "receipt_payment_details": [{
+                **{column.name: getattr(detail, column.name) for column in detail.__table__.columns},
+                **format_dates(detail)
+            } for detail in ReceiptPaymentDetail.query.filter_by(tranid=tranid).all()]
+        }
+
+        return jsonify(response), 200
+
+    except Exception as e:
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
+
+# Insert record for ReceiptPaymentHead and ReceiptPaymentDetail
+@app.route(API_URL + "/insert-receiptpayment", methods=["POST"])
+def insert_receiptpayment():
+    def create_gledger_entry(data, amount, drcr, ac_code, accoid, DRCR_Head):
+        return {
+            "TRAN_TYPE": tran_type,
+            "DOC_NO": new_doc_no,
+            "DOC_DATE": data['doc_date'],
+            "AC_CODE": ac_code,
+            "AMOUNT": amount,
+            "COMPANY_CODE": data['company_code'],
+            "YEAR_CODE": data['year_code'],
+            "ORDER_CODE": 12,
+            "DRCR": drcr,
+            "UNIT_Code": 0,
+            "NARRATION": item['narration'],
+            "TENDER_ID": 0,
+            "TENDER_ID_DETAIL": 0,
+            "VOUCHER_ID": 0,
+            "DRCR_HEAD": DRCR_Head,
+            "ADJUSTED_AMOUNT": 0,
+            "Branch_Code": 1,
+            "SORT_TYPE": tran_type,
+            "SORT_NO": new_doc_no,
+            "vc": 0,
+            "progid": 0,
+            "tranid": 0,
+            "saleid": 0,
+            "ac": accoid
+        }
+    
+    def add_gledger_entry(entries, data, amount, drcr, ac_code, accoid, DRCR_Head):
+        if amount > 0:
+            entries.append(create_gledger_entry(data, amount, drcr, ac_code, accoid, DRCR_Head))
+            
+    try:
+        data = request.get_json()
+        headData = data['head_data']
+        detailData = data['detail_data']
+       
+        tran_type = headData.get('tran_type')
+        if not tran_type:
+            return jsonify({"error": "Bad Request", "message": "tran_type is required"}), 400
+
+        new_doc_no = receipt_payment_numbers.next(headData['company_code'], headData['year_code'], tran_type)
+        headData['doc_no'] = new_doc_no
+
+        new_head = ReceiptPaymentHead(**headData)
+        db.session.add(new_head)
+        db.session.flush()
+
+        print(new_head)
+
+        changes = receipt_payment_details.apply(
+            detailData,
+            add_values={'doc_no': new_doc_no, 'tranid': new_head.tranid, 'Tran_Type': new_head.tran_type},
+            update_values={'doc_no': new_doc_no, 'Tran_Type': new_head.tran_type}
+        )
+        createdDetails, updatedDetails, deletedDetailIds = changes.added, changes.updated, changes.deleted
+
+        gledger_entries = []
+
+        for item in detailData:
+            amount = float(item.get('amount', 0) or 0)
+            DrCr = item['drcr']
+            credit_ac = item['credit_ac']
+            cashbank = headData['cashbank']
+            debit_ac = item['debit_ac']
+        
+            if amount > 0:
+                if tran_type in ["CP", "BP"]:
+                    add_gledger_entry(gledger_entries, headData, amount, "C", cashbank, get_accoid(cashbank, headData['company_code']), credit_ac)
+                    add_gledger_entry(gledger_entries, headData, amount, "D", credit_ac, get_accoid(credit_ac, headData['company_code']), cashbank)
+                elif tran_type in ["BR", "CR"]:
+                    add_gledger_entry(gledger_entries, headData, amount, "D", cashbank, get_accoid(cashbank, headData['company_code']), credit_ac)
+                    add_gledger_entry(gledger_entries, headData, amount, "C", credit_ac, get_accoid(credit_ac, headData['company_code']), cashbank)
+                elif tran_type in ["JV"]:
+                    add_gledger_entry(gledger_entries, headData, amount, DrCr, debit_ac, get_accoid(debit_ac, headData['company_code']), 99999999)
+
+        post_gledger_entries(headData['company_code'], new_doc_no, headData['year_code'], headData['tran_type'], gledger_entries, new_document=True)
+        db.session.commit()
+
+        return jsonify({
+            "message": "Data Inserted successfully",
+            "head": receipt_payment_head_schema.dump(new_head),
+            "addedDetails": receipt_payment_detail_schemas.dump(createdDetails),
+            "updatedDetails": updatedDetails,
+            "deletedDetailIds": deletedDetailIds
+        }), 201
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
+
+# Update record for ReceiptPaymentHead and ReceiptPaymentDetail
+@app.route(API_URL + "/update-receiptpayment", methods=["PUT"])
+def update_receiptpayment():
+    def create_gledger_entry(data, amount, drcr, ac_code, accoid, DRCR_Head):
+        return {
+            "TRAN_TYPE": tran_type,
+            "DOC_NO": updated_head.doc_no,
+            "DOC_DATE": data['doc_date'],
+            "AC_CODE": ac_code,
+            "AMOUNT": amount,
+            "COMPANY_CODE": data['company_code'],
+            "YEAR_CODE": data['year_code'],
+            "ORDER_CODE": 12,
+            "DRCR": drcr,
+            "UNIT_Code": 0,
+            "NARRATION": item['narration'],
+            "TENDER_ID": 0,
+            "TENDER_ID_DETAIL": 0,
+            "VOUCHER_ID": 0,
+            "DRCR_HEAD": DRCR_Head,
+            "ADJUSTED_AMOUNT": 0,
+            "Branch_Code": 1,
+            "SORT_TYPE": tran_type,
+            "SORT_NO": updated_head.doc_no,
+            "vc": 0,
+            "progid": 0,
+            "tranid": 0,
+            "saleid": 0,
+            "ac": accoid
+        }
+    
+    def add_gledger_entry(entries, data, amount, drcr, ac_code, accoid, DRCR_Head):
+        if amount > 0:
+            entries.append(create_gledger_entry(data, amount, drcr, ac_code, accoid, DRCR_Head))
+            
+    try:
+        tranid = request.args.get('tranid')
+        if not tranid:
+            return jsonify({"error": "Missing 'tranid' parameter"}), 400
+
+        data = request.get_json()
+        headData = data['head_data']
+        detailData = data['detail_data']
+
+        tran_type = headData.get('tran_type')
+        if not tran_type:
+            return jsonify({"error": "Bad Request", "message": "tran_type is required"}), 400
+
+        updated_head_count = db.session.query(ReceiptPaymentHead).filter(ReceiptPaymentHead.tranid == tranid).update(headData)
+        updated_head = ReceiptPaymentHead.query.filter_by(tranid=tranid).first()
+
+        changes = receipt_payment_details.apply(
+            detailData,
+            add_values={'doc_no': updated_head.doc_no, 'tranid': updated_head.tranid, 'Tran_Type': updated_head.tran_type},
+            update_values={'Tran_Type': updated_head.tran_type}
+        )
+        created_details, updated_details, deleted_detail_ids = changes.added, changes.updated, changes.deleted
+
+        gledger_entries = []
+
+        for item in detailData:
+            amount = float(item.get('amount', 0) or 0)
+            credit_ac = item['credit_ac']
+            cashbank = headData['cashbank']
+            DrCr = item['drcr']
+            debit_ac = item['debit_ac']
+
+            if amount > 0:
+                if tran_type in ["CP", "BP"]:
+                    add_gledger_entry(gledger_entries, headData, amount, "C", cashbank, get_accoid(cashbank, headData['company_code']), credit_ac)
+                    add_gledger_entry(gledger_entries, headData, amount, "D", credit_ac, get_accoid(credit_ac, headData['company_code']), cashbank)
+                elif tran_type in ["BR", "CR"]:
+                    add_gledger_entry(gledger_entries, headData, amount, "D", cashbank, get_accoid(cashbank, headData['company_code']), credit_ac)
+                    add_gledger_entry(gledger_entries, headData, amount, "C", credit_ac, get_accoid(credit_ac, headData['company_code']), cashbank)
+                elif tran_type in ["JV"]:
+                    add_gledger_entry(gledger_entries, headData, amount, DrCr, debit_ac, get_accoid(debit_ac, headData['company_code']), 99999999)
+
+        post_gledger_entries(headData['company_code'], updated_head.doc_no, headData['year_code'], headData['tran_type'], gledger_entries)
+        db.session.commit()
+
+        return jsonify({
+            "message": "Data updated successfully",
+            "head": updated_head_count,
+            "created_details": receipt_payment_detail_schemas.dump(created_details),
+            "updated_details": updated_details,
+            "deleted_detail_ids": deleted_detail_ids
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
+
+
+# Delete record from database based on tranid
+@app.route(API_URL + "/delete_data_by_tranid", methods=["DELETE"])
+def delete_data_by_tranid():
+    try:
+        tranid = request.args.get('tranid')
+        company_code = request.args.get('company_code')
+        year_code = request.args.get('year_code')
+        doc_no = request.args.get('doc_no')
+        tran_type = request.args.get('Tran_Type')
+
+        if not all([tranid, company_code,year_code,doc_no,tran_type]):
+            return jsonify({"error": "Missing required parameters"}), 400
+
+        with db.session.begin():
+            deleted_detail_rows = ReceiptPaymentDetail.query.filter_by(tranid=tranid).delete()
+            deleted_head_rows = ReceiptPaymentHead.query.filter_by(tranid=tranid).delete()
+
+            if deleted_detail_rows > 0 and deleted_head_rows > 0:
+                delete_gledger_entries(company_code, doc_no, year_code, tran_type)
+
+        db.session.commit()
+
+        return jsonify({
+            "message": f"Deleted {deleted_head_rows} head row(s) and {deleted_detail_rows} detail row(s) successfully"
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
+
+@app.route(API_URL + "/get-firstreceiptpayment-navigation", methods=["GET"])
+def get_firstreceiptpayment_navigation():
+    try:
+        Company_Code = request.args.get('Company_Code')
+        Year_Code = request.args.get('Year_Code')
+        tran_type = request.args.get('tran_type')
+        if not all([Company_Code, Year_Code, tran_type]):
+            return jsonify({"error": "Missing required parameters"}), 400
+
+        first_receipt_payment_head = ReceiptPaymentHead.query.filter_by(company_code=Company_Code, year_code=Year_Code, tran_type=tran_type).order_by(ReceiptPaymentHead.doc_no.asc()).first()
+        if not first_receipt_payment_head:
+            return jsonify({"error": "No records found"}), 404
+
+        tranid = first_receipt_payment_head.tranid
+        additional_data = db.session.execute(text(RECEIPT_PAYMENT_DETAILS_QUERY), {"tranid": tranid})
+        additional_data_rows = additional_data.fetchall()
+
+        labels = [dict(row._mapping) for row in additional_data_rows]
+
+        first_head_data = {
+            **{column.name: getattr(first_receipt_payment_head, column.name) for column in first_receipt_payment_head.__table__.columns},
+            **format_dates(first_receipt_payment_head)
+        }
+
+        first_details_data = [
+            {
+                **{column.name: getattr(detail, column.name) for column in detail.__table__.columns},
+                **format_dates(detail)
+            } for detail in ReceiptPaymentDetail.query.filter_by(tranid=tranid).all()
+        ]
+
+        response = {
+            "first_head_data": first_head_data,
+            "labels": labels,
+            "first_details_data": first_details_data
+        }
+
+        return jsonify(response), 200
+
+    except Exception as e:
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
+
+# Get last record from the database
+@app.route(API_URL + "/get-lastreceiptpayment-navigation", methods=["GET"])
+def get_lastreceiptpayment_navigation():
+    try:
+        Company_Code = request.args.get('Company_Code')
+        Year_Code = request.args.get('Year_Code')
+        tran_type = request.args.get('tran_type')
+        if not all([Company_Code, Year_Code, tran_type]):
+            return jsonify({"error": "Missing required parameters"}), 400
+
+        last_receipt_payment_head = ReceiptPaymentHead.query.filter_by(company_code=Company_Code, year_code=Year_Code, tran_type=tran_type).order_by(ReceiptPaymentHead.doc_no.desc()).first()
+        if not last_receipt_payment_head:
+            return jsonify({"error": "No records found"}), 404
+
+        tranid = last_receipt_payment_head.tranid
+        additional_data = db.session.execute(text(RECEIPT_PAYMENT_DETAILS_QUERY), {"tranid": tranid})
+        additional_data_rows = additional_data.fetchall()
+
+        labels = [dict(row._mapping) for row in additional_data_rows]
+
+        last_head_data = {
+            **{column.name: getattr(last_receipt_payment_head, column.name) for column in last_receipt_payment_head.__table__.columns},
+            **format_dates(last_receipt_payment_head)
+        }
+
+        last_details_data = [
+            {
+                **{column.name: getattr(detail, column.name) for column in detail.__table__.columns},
+                **format_dates(detail)
+            } for detail in ReceiptPaymentDetail.query.filter_by(tranid=tranid).all()
+        ]
+
+        response = {
+            "last_head_data": last_head_data,
+            "labels": labels,
+            "last_details_data": last_details_data
+        }
+
+        return jsonify(response), 200
+
+    except Exception as e:
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
+
+# Get previous record from the database
+@app.route(API_URL + "/get-previousreceiptpayment-navigation", methods=["GET"])
+def get_previousreceiptpayment_navigation():
+    try:
+        current_doc_no = request.args.get('currentDocNo')
+        Company_Code = request.args.get('Company_Code')
+        Year_Code = request.args.get('Year_Code')
+        tran_type = request.args.get('tran_type')
+        if not all([Company_Code, Year_Code, current_doc_no, tran_type]):
+            return jsonify({"error": "Missing required parameters"}), 400
+
+        previous_receipt_payment_head = ReceiptPaymentHead.query.filter(ReceiptPaymentHead.doc_no < current_doc_no).filter_by(company_code=Company_Code, year_code=Year_Code, tran_type=tran_type).order_by(ReceiptPaymentHead.doc_no.desc()).first()
+        if not previous_receipt_payment_head:
+            return jsonify({"error": "No previous records found"}), 404
+
+        tranid = previous_receipt_payment_head.tranid
+        additional_data = db.session.execute(text(RECEIPT_PAYMENT_DETAILS_QUERY), {"tranid": tranid})
+        additional_data_rows = additional_data.fetchall()
+
+        labels = [dict(row._mapping) for row in additional_data_rows]
+
+        previous_head_data = {
+            **{column.name: getattr(previous_receipt_payment_head, column.name) for column in previous_receipt_payment_head.__table__.columns},
+            **format_dates(previous_receipt_payment_head)
+        }
+
+        previous_details_data = [
+            {
+                **{column.name: getattr(detail, column.name) for column in detail.__table__.columns},
+                **format_dates(detail)
+            } for detail in ReceiptPaymentDetail.query.filter_by(tranid=tranid).all()
+        ]
+
+        response = {
+            "previous_head_data": previous_head_data,
+            "labels": labels,
+            "previous_details_data": previous_details_data
+        }
+
+        return jsonify(response), 200
+
+    except Exception as e:
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
+
+# Get next record from the database
+@app.route(API_URL + "/get-nextreceiptpayment-navigation", methods=["GET"])
+def get_nextreceiptpayment_navigation():
+    try:
+        current_doc_no = request.args.get('currentDocNo')
+        Company_Code = request.args.get('Company_Code')
+        Year_Code = request.args.get('Year_Code')
+        tran_type = request.args.get('tran_type')
+        if not all([Company_Code, Year_Code, current_doc_no, tran_type]):
+            return jsonify({"error": "Missing required parameters"}), 400
+
+        next_receipt_payment_head = ReceiptPaymentHead.query.filter(ReceiptPaymentHead.doc_no > current_doc_no).filter_by(company_code=Company_Code, year_code=Year_Code, tran_type=tran_type).order_by(ReceiptPaymentHead.doc_no.asc()).first()
+        if not next_receipt_payment_head:
+            return jsonify({"error": "No next records found"}), 404
+
+        tranid = next_receipt_payment_head.tranid
+        additional_data = db.session.execute(text(RECEIPT_PAYMENT_DETAILS_QUERY), {"tranid": tranid})
+        additional_data_rows = additional_data.fetchall()
+
+        labels = [dict(row._mapping) for row in additional_data_rows]
+
+        next_head_data = {
+            **{column.name: getattr(next_receipt_payment_head, column.name) for column in next_receipt_payment_head.__table__.columns},
+            **format_dates(next_receipt_payment_head)
+        }
+
+        next_details_data = [
+            {
+                **{column.name: getattr(detail, column.name) for column in detail.__table__.columns},
+                **format_dates(detail)
+            } for detail in ReceiptPaymentDetail.query.filter_by(tranid=tranid).all()
+        ]
+
+        response = {
+            "next_head_data": next_head_data,
+            "labels": labels,
+            "next_details_data": next_details_data
+        }
+
+        return jsonify(response), 200
+
+    except Exception as e:
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
@@ -0,0 +1,75 @@
+from flask import jsonify, request
+from app import app, db
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, text
+from app.utils.HelpIndex import HelpList, help_response
+import os
+# Get the base URL from environment variables
+API_URL = os.getenv('API_URL')
+
+ACCOUNT_MASTER_HELP_QUERY = '''
+                SELECT dbo.nt_1_accountmaster.Ac_Code, dbo.nt_1_accountmaster.Ac_Name_E, dbo.nt_1_accountmaster.Ac_type,
+                       dbo.nt_1_citymaster.city_name_e as cityname, dbo.nt_1_accountmaster.Gst_No, 
+                       dbo.nt_1_accountmaster.accoid, dbo.nt_1_accountmaster.Mobile_No
+                FROM dbo.nt_1_accountmaster 
+                LEFT OUTER JOIN dbo.nt_1_citymaster 
+                ON dbo.nt_1_accountmaster.City_Code = dbo.nt_1_citymaster.city_code 
+                AND dbo.nt_1_accountmaster.company_code = dbo.nt_1_citymaster.company_code 
+                WHERE Locked=0 
+                AND dbo.nt_1_accountmaster.Company_Code=:company_code
+'''
+
+
+def load_account_master_help(scope, accoids):
+    query = ACCOUNT_MASTER_HELP_QUERY
+    params = {'company_code': scope[0]}
+    if accoids is not None:
+        query += " AND dbo.nt_1_accountmaster.accoid IN :accoids"
+        params['accoids'] = accoids
+    statement = text(query + " ORDER BY Ac_Name_E DESC")
+    if accoids is not None:
+        statement = statement.bindparams(bindparam('accoids', expanding=True))
+
+    # Start a database transaction
+    with db.session.begin_nested():
+        result = db.session.execute(statement, params).fetchall()
+
+    response = []
+    for row in result:
+        response.append({
+            'Ac_Code': row.Ac_Code,
+            'Ac_type': row.Ac_type,
+            'Ac_Name_E': row.Ac_Name_E,
+            'cityname': row.cityname,
+            'Gst_No': row.Gst_No,
+            'accoid': row.accoid,
+            'Mobile_No': row.Mobile_No
+        })
+    return response
+
+
+account_master_help = HelpList('account_master', load_account_master_help, key='accoid',
+                               name_fields=('Ac_Name_E',), code_fields=('Ac_Code', 'Gst_No', 'Mobile_No'),
+                               sort_key=lambda row: (row['Ac_Name_E'] or '').lower(), reverse=True)
+
+
+@app.route(API_URL+'/account_master_all', methods=['GET'])
+def account_master_all():
+    try:
+        # Extract Company_Code from query parameters
+        Company_Code = request.args.get('Company_Code')
+        if Company_Code is None:
+            return jsonify({'error': 'Missing Company_Code parameter'}), 400
+
+        try:
+            Company_Code = int(Company_Code)
+        except ValueError:
+            return jsonify({'error': 'Invalid Company_Code parameter'}), 400
+
+        return help_response(account_master_help, (Company_Code,))
+
+    except SQLAlchemyError as error:
+        # Handle database errors
+        print("Error fetching data:", error)
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error'}), 500
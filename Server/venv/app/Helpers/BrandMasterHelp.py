@@ -0,0 +1,58 @@
+from flask import jsonify, request
+from app import app, db
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, text
+from app.utils.HelpIndex import HelpList, help_response
+import os
+# Get the base URL from environment variables
+API_URL = os.getenv('API_URL')
+
+
+def load_brand_master_help(scope, codes):
+    query = '''
+                SELECT Code as brand_Code, English_Name AS brand_Name
+                FROM Brand_Master
+                WHERE Company_Code=:company_code
+            '''
+    params = {'company_code': scope[0]}
+    statement = text(query)
+    if codes is not None:
+        statement = text(query + " AND Code IN :codes").bindparams(bindparam('codes', expanding=True))
+        params['codes'] = codes
+
+    # Start a database transaction
+    with db.session.begin_nested():
+        result = db.session.execute(statement, params).fetchall()
+
+    response = []
+    for row in result:
+        response.append({
+            'brand_Code': row.brand_Code,
+            'brand_Name': row.brand_Name
+        })
+    return response
+
+
+brand_master_help = HelpList('brand_master', load_brand_master_help, key='brand_Code',
+                             name_fields=('brand_Name',), code_fields=('brand_Code',))
+
+
+@app.route(API_URL+'/brand_master', methods=['GET'])
+def brand_master():
+    try:
+        # Extract Company_Code from query parameters
+        Company_Code = request.args.get('Company_Code')
+        if Company_Code is None:
+            return jsonify({'error': 'Missing Company_Code parameter'}), 400
+
+        try:
+            Company_Code = int(Company_Code)
+        except ValueError:
+            return jsonify({'error': 'Invalid Company_Code parameter'}), 400
+
+        return help_response(brand_master_help, (Company_Code,))
+
+    except SQLAlchemyError as error:
+        print("Error fetching data:", error)
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error'}), 500
@@ -0,0 +1,61 @@
+
+import os
+from flask import jsonify, request
+from app import app, db
+from sqlalchemy.exc import SQLAlchemyError 
+from sqlalchemy import bindparam, text
+from app.utils.HelpIndex import HelpList, help_response
+
+API_URL = os.getenv('API_URL')
+
+
+def load_city_master_help(scope, cityids):
+    query = "select city_code,city_name_e,city_name_r,state,cityid from nt_1_citymaster WHERE Company_Code=:company_code"
+    params = {'company_code': scope[0]}
+    if cityids is not None:
+        query += " AND cityid IN :cityids"
+        params['cityids'] = cityids
+    statement = text(query + " order by city_name_e")
+    if cityids is not None:
+        statement = statement.bindparams(bindparam('cityids', expanding=True))
+
+    # Start a database transaction
+    with db.session.begin_nested():
+        result = db.session.execute(statement, params).fetchall()
+
+    response = []
+    for row in result:
+        response.append({
+            'city_code': row.city_code,
+            'city_name_e': row.city_name_e,
+            'city_name_r': row.city_name_r,
+            'state': row.state,
+            'cityid': row.cityid
+        })
+    return response
+
+
+city_master_help = HelpList('city_master', load_city_master_help, key='cityid',
+                            name_fields=('city_name_e', 'city_name_r'), code_fields=('city_code',),
+                            sort_key=lambda row: (row['city_name_e'] or '').lower())
+
+
+@app.route(API_URL+'/group_city_master', methods=['GET'])
+def group_city_master():
+    try:
+        Company_Code = request.args.get('Company_Code')
+        if Company_Code is None:
+            return jsonify({'error': 'Missing Company_Code parameter'}), 400
+
+        try:
+            Company_Code = int(Company_Code)
+        except ValueError:
+            return jsonify({'error': 'Invalid Company_Code parameter'}), 400
+
+        return help_response(city_master_help, (Company_Code,))
+
+    except SQLAlchemyError as error:
+        # Handle database errors
+        print("Error fetching data:", error)
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error'}), 500
@@ -0,0 +1,59 @@
+import os
+from flask import jsonify, request
+from app import app, db 
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, text
+from app.utils.HelpIndex import HelpList, help_response
+
+API_URL = os.getenv('API_URL')
+
+
+def load_group_master_help(scope, bsids):
+    query = '''
+            SELECT group_Code, group_Name_E,  bsid
+            FROM nt_1_bsgroupmaster
+            WHERE Company_Code=:company_code
+            '''
+    params = {'company_code': scope[0]}
+    statement = text(query)
+    if bsids is not None:
+        statement = text(query + " AND bsid IN :bsids").bindparams(bindparam('bsids', expanding=True))
+        params['bsids'] = bsids
+
+    # Start a database transaction
+    with db.session.begin_nested():
+        result = db.session.execute(statement, params).fetchall()
+
+    response = []
+    for row in result:
+        response.append({
+            'group_Code': row.group_Code,
+            'group_Name_E': row.group_Name_E,
+            'bsid': row.bsid
+        })
+    return response
+
+
+group_master_help = HelpList('group_master', load_group_master_help, key='bsid',
+                             name_fields=('group_Name_E',), code_fields=('group_Code',))
+
+
+@app.route(API_URL+'/group_master', methods=['GET'])
+def group_master():
+    try:
+        Company_Code = request.args.get('Company_Code')
+        if Company_Code is None:
+            return jsonify({'error': 'Missing Company_Code parameter'}), 400
+
+        try:
+            Company_Code = int(Company_Code)
+        except ValueError:
+            return jsonify({'error': 'Invalid Company_Code parameter'}), 400
+
+        return help_response(group_master_help, (Company_Code,))
+
+    except SQLAlchemyError as error:
+        # Handle database errors
+        print("Error fetching data:", error)
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error'}), 500
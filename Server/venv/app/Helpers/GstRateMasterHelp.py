@@ -0,0 +1,59 @@
+from flask import jsonify, request
+from app import app, db
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, text
+from app.utils.HelpIndex import HelpList, help_response
+import os
+# Get the base URL from environment variables
+API_URL = os.getenv('API_URL')
+
+
+def load_gst_rate_master_help(scope, doc_nos):
+    query = '''
+                SELECT Doc_no, GST_Name, Rate
+                FROM NT_1_GSTRateMaster
+                WHERE Company_Code=:company_code
+            '''
+    params = {'company_code': scope[0]}
+    statement = text(query)
+    if doc_nos is not None:
+        statement = text(query + " AND Doc_no IN :doc_nos").bindparams(bindparam('doc_nos', expanding=True))
+        params['doc_nos'] = doc_nos
+
+    # Start a database transaction
+    with db.session.begin_nested():
+        result = db.session.execute(statement, params).fetchall()
+
+    response = []
+    for row in result:
+        response.append({
+            'Doc_no': row.Doc_no,
+            'GST_Name': row.GST_Name,
+            'Rate': row.Rate
+        })
+    return response
+
+
+gst_rate_master_help = HelpList('gst_rate_master', load_gst_rate_master_help, key='Doc_no',
+                                name_fields=('GST_Name',), code_fields=('Doc_no',))
+
+
+@app.route(API_URL+'/gst_rate_master', methods=['GET'])
+def gst_rate_master():
+    try:
+        # Extract Company_Code from query parameters
+        Company_Code = request.args.get('Company_Code')
+        if Company_Code is None:
+            return jsonify({'error': 'Missing Company_Code parameter'}), 400
+
+        try:
+            Company_Code = int(Company_Code)
+        except ValueError:
+            return jsonify({'error': 'Invalid Company_Code parameter'}), 400
+
+        return help_response(gst_rate_master_help, (Company_Code,))
+
+    except SQLAlchemyError as error:
+        print("Error fetching data:", error)
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error'}), 500
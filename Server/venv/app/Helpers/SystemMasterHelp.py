@@ -0,0 +1,65 @@
+from flask import jsonify, request
+from app import app, db
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, text
+from app.utils.HelpIndex import HelpList, help_response
+import os
+
+API_URL = os.getenv('API_URL')
+
+
+def load_system_master_help(scope, systemids):
+    company_code, system_type = scope
+    query = '''
+                SELECT System_Code AS Category_Code, System_Name_E AS Category_Name, systemid AS accoid, HSN
+                FROM nt_1_systemmaster 
+                WHERE System_Type = :system_type 
+                AND Company_Code = :company_code
+            '''
+    params = {'system_type': system_type, 'company_code': company_code}
+    statement = text(query)
+    if systemids is not None:
+        statement = text(query + " AND systemid IN :systemids").bindparams(bindparam('systemids', expanding=True))
+        params['systemids'] = systemids
+
+    # Start a database transaction
+    with db.session.begin_nested():
+        result = db.session.execute(statement, params).fetchall()
+
+    response = []
+    for row in result:
+        response.append({
+            'Category_Code': row.Category_Code,
+            'Category_Name': row.Category_Name,
+            'accoid': row.accoid,
+            'HSN':row.HSN
+        })
+    return response
+
+
+system_master_help = HelpList('system_master', load_system_master_help, key='accoid',
+                              name_fields=('Category_Name',), code_fields=('Category_Code', 'HSN'))
+
+
+@app.route(API_URL+'/system_master_help', methods=['GET'])
+def system_master():
+    try:
+        # Extract SystemType and CompanyCode from query parameters
+        SystemType = request.args.get('SystemType')
+        CompanyCode = request.args.get('CompanyCode')
+
+        if SystemType is None or CompanyCode is None:
+            return jsonify({'error': 'Missing SystemType or CompanyCode parameter'}), 400
+
+        try:
+            CompanyCode = int(CompanyCode)
+        except ValueError:
+            return jsonify({'error': 'Invalid CompanyCode parameter'}), 400
+
+        return help_response(system_master_help, (CompanyCode, SystemType))
+
+    except SQLAlchemyError as error:
+        # Handle database errors
+        print("Error fetching data:", error)
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error'}), 500
@@ -0,0 +1,154 @@
+
+from flask import jsonify
+from app import app, db
+from sqlalchemy.exc import SQLAlchemyError 
+from sqlalchemy import text
+from flask import jsonify, request
+import os
+
+
+
+API_URL = os.getenv('API_URL')
+
+
+@app.route(API_URL+'/purchno', methods=['GET'])
+def purcno():
+    try:
+        CompanyCode = request.args.get('CompanyCode')
+        MillCode = request.args.get('MillCode')
+
+        #Tender_No = request.args.get('Tender_No')
+
+        if  CompanyCode is None or MillCode is None:
+            return jsonify({'error': 'Missing MillCode or CompanyCode parameter'}), 400
+
+        # The pending tender details and their quantities come from the tender balance index
+        # (nt_1_tenderbalance), kept up to date by the documents that dispatch against them
+        # Start a database transaction
+        with db.session.begin_nested():
+            query = db.session.execute(text('''
+               select dbo.nt_1_tender.Tender_No,CONVERT(varchar(10), dbo.nt_1_tender.Tender_Date, 103) as Tender_Date,buyer.Ac_Name_E as Party2,
+                           buyerparty.Ac_Name_E as Party,dbo.nt_1_tender.Mill_Rate,dbo.nt_1_tender.Grade,dbo.nt_1_tenderdetails.Sale_Rate,
+                           dbo.nt_1_tenderbalance.Buyer_Quantal,dbo.nt_1_tenderbalance.DESPATCH,dbo.nt_1_tenderbalance.BALANCE,
+                           tenderdo.Ac_Name_E as doname,CONVERT(varchar(10), dbo.nt_1_tenderdetails.Lifting_Date, 103) as Lifting_Date,
+                           dbo.nt_1_tenderdetails.ID,dbo.nt_1_tenderdetails.tenderdetailid,dbo.nt_1_tenderdetails.tenderid,
+                           dbo.nt_1_tenderdetails.Delivery_Type,shipto.Ac_Name_E as shiptoname,tenderdo.Short_Name as tenderdoshortname,
+                           dbo.nt_1_tender.season,dbo.nt_1_tender.Party_Bill_Rate
+               from dbo.nt_1_tenderbalance
+               inner join dbo.nt_1_tenderdetails on dbo.nt_1_tenderbalance.tenderdetailid = dbo.nt_1_tenderdetails.tenderdetailid
+               inner join dbo.nt_1_tender on dbo.nt_1_tenderdetails.tenderid = dbo.nt_1_tender.tenderid
+               left outer join dbo.nt_1_accountmaster as buyer on dbo.nt_1_tenderdetails.buyerid = buyer.accoid
+               left outer join dbo.nt_1_accountmaster as buyerparty on dbo.nt_1_tenderdetails.buyerpartyid = buyerparty.accoid
+               left outer join dbo.nt_1_accountmaster as shipto on dbo.nt_1_tenderdetails.shiptoid = shipto.accoid
+               left outer join dbo.nt_1_accountmaster as tenderdo on dbo.nt_1_tender.td = tenderdo.accoid
+               where dbo.nt_1_tenderbalance.Company_Code= :CompanyCode and dbo.nt_1_tenderbalance.Mill_Code= :MillCode
+                 and dbo.nt_1_tenderbalance.BALANCE != 0
+            '''), {'CompanyCode':CompanyCode, 'MillCode':MillCode})
+
+            result = query.fetchall()
+
+        response = []
+        for row in result:
+            response.append({
+                'Tender_No': row.Tender_No,
+                'Tender_DateConverted': row.Tender_Date,
+                'buyername': row.Party2,
+                'buyerpartyname': row.Party,
+                'Mill_Rate': row.Mill_Rate,
+                'Grade':row.Grade,
+                'Sale_Rate':row.Sale_Rate,
+                'Buyer_Quantal':row.Buyer_Quantal,
+                'DESPATCH':row.DESPATCH,
+                'BALANCE':row.BALANCE,
+                'tenderdoname':row.doname,
+                'Lifting_DateConverted':row.Lifting_Date,
+                'ID':row.ID,
+                'tenderdetailid':row.tenderdetailid,
+                'tenderid':row.tenderid,
+                'Delivery_Type':row.Delivery_Type,
+                'shiptoname':row.shiptoname,
+                'tenderdoshortname':row.tenderdoshortname,
+                'season':row.season,
+                'Party_Bill_Rate':row.Party_Bill_Rate
+
+
+            })
+
+        return jsonify(response)
+
+    except SQLAlchemyError as error:
+        # Handle database errors
+        print("Error fetching data:", error)
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error'}), 500
+    
+
+
+@app.route(API_URL + "/getTenderNo_Data", methods=["GET"])
+def getTenderNo_Data():
+    try:
+        Company_Code = request.args.get('CompanyCode')
+        Tenderno = request.args.get('Tender_No')
+        Year_Code = request.args.get('Year_Code')
+        ID = request.args.get('ID')
+
+        if not all([Company_Code, Tenderno, ID]):
+            return jsonify({"error": "Missing required parameters"}), 400
+
+        with db.session.begin_nested():
+            # Execute query2 first
+            query2 = db.session.execute(
+                text('''
+                    SELECT dbo.nt_1_companyparameters.SELF_AC, dbo.nt_1_accountmaster.accoid, dbo.nt_1_accountmaster.Ac_Name_E
+                    FROM dbo.nt_1_companyparameters
+                    INNER JOIN dbo.nt_1_accountmaster ON dbo.nt_1_companyparameters.Company_Code = dbo.nt_1_accountmaster.company_code 
+                      AND dbo.nt_1_companyparameters.SELF_AC = dbo.nt_1_accountmaster.Ac_Code
+                    WHERE dbo.nt_1_companyparameters.Year_Code = :Year_Code 
+                      AND dbo.nt_1_companyparameters.Company_Code = :Company_Code
+                '''),
+                {'Year_Code': Year_Code, 'Company_Code': Company_Code}
+            )
+            SelfAc_data = [dict(row._mapping) for row in query2.fetchall()]
+            selfacname=SelfAc_data[0].get('Ac_Name_E', None)
+            selfac=SelfAc_data[0].get('SELF_AC', None)
+            selfacid=SelfAc_data[0].get('accoid', None)
+            
+            
+            # Now execute query1
+            query = db.session.execute(
+                text('''
+                    SELECT Buyer, buyername, Buyer_Party, buyerpartyname, Voucher_By, voucherbyname, Grade, 
+                           Buyer_Quantal AS Quantal, Packing, Bags, Excise_Rate, Mill_Rate, Sale_Rate, 
+                           Tender_DO, tenderdoname, Broker, brokername, Commission_Rate AS CR, 
+                           Delivery_Type AS DT, Payment_To, paymenttoname, gstratecode, gstratename, 
+                           itemcode, itemname, tenderdetailid, ShipToname, shiptoid, ShipTo, season, 
+                           Party_Bill_Rate, AutoPurchaseBill, buyerpartygststatecode, buyerpartystatename, 
+                           buyerpartyid, buyerid, shiptoid, pt, ic, td, gstrate,
+                           (case when Delivery_Type='DO' then Buyer else :selfac end) as Getpassno,
+                           (case when Delivery_Type='DO' then buyerid else :selfacid end) as Getpassnoid,
+                           (case when Delivery_Type='DO' then buyername else :selfacname end) as Getpassnoname  
+                     
+                    FROM qrytenderheaddetail
+                    WHERE Company_Code = :Company_Code 
+                      AND Tender_No = :Tender_No 
+                      AND ID = :ID
+                '''),
+                 {'Company_Code': Company_Code, 'Tender_No': Tenderno, 'ID': ID,
+                   'selfac': selfac,'selfacname':selfacname,'selfacid':selfacid}
+      
+                
+            )
+
+            result = query.fetchall()
+            last_details_data = [dict(row._mapping) for row in result]
+
+            response = {
+                "last_details_data": last_details_data,
+               
+            }
+
+            return jsonify(response), 200
+
+    except Exception as e:
+        return jsonify({"error": "Internal server error", "message": str(e)}), 500
+
@@ -0,0 +1,115 @@
+# app.py
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from flask_cors import CORS
+from dotenv import load_dotenv
+import os
+from flask_jwt_extended import JWTManager
+from flask_socketio import SocketIO
+
+# Load environment variables from .env file
+load_dotenv()
+
+app = Flask(__name__)
+CORS(app)
+
+# Set the database URI using environment variables
+# DATABASE_URL overrides the SQL Server connection (used by the offline benchmarks)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL') or f"mssql+pymssql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+db = SQLAlchemy(app)
+
+# Per-request SQL instrumentation (app/utils/SqlMetrics.py). The X-DB-* headers are added in
+# debug mode or with SQL_METRICS_HEADERS set; requests slower than SLOW_REQUEST_MS are logged
+app.config['SLOW_REQUEST_MS'] = float(os.getenv('SLOW_REQUEST_MS', '1000'))
+app.config['SQL_REPEAT_THRESHOLD'] = int(os.getenv('SQL_REPEAT_THRESHOLD', '5'))
+app.config['SQL_METRICS_HEADERS'] = os.getenv('SQL_METRICS_HEADERS', '').lower() in ('1', 'true', 'yes')
+from app.utils.SqlMetrics import init_sql_metrics
+init_sql_metrics(app)
+
+# Initialize JWTManager with your app 
+app.config['JWT_SECRET_KEY'] = 'ABCEFGHIJKLMNOPQRSTUVWXYZ'
+jwt = JWTManager(app)
+
+# Initialize SocketIO
+socketio = SocketIO(app, cors_allowed_origins="http://localhost:3000")
+
+app.config['UPLOAD_FOLDER'] = os.getenv('UPLOAD_FOLDER')
+
+# Ensure the upload directory exists
+os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+
+# The rest of your application configuration and routes
+
+# Import controllers and helpers
+from app.Controllers.Company.CompanyCreation.CompanyCreation import *
+from app.Controllers.LoginAndCompanyList.Login.LoginController import *
+from app.Controllers.LoginAndCompanyList.CompanyList.CompanyList import *
+from app.Controllers.Company.AccountingYear.AccountingYear import *
+from app.Controllers.LoginAndCompanyList.UserLogin.UserLoginController import *
+from app.Controllers.Masters.AccountInformation.FinicialMastersController import *
+from app.Controllers.Masters.OtherMasters.GstStateMasterController import *
+from app.Controllers.Masters.AccountInformation.CityMasterController import *
+from app.Controllers.Masters.OtherMasters.BrandMasterController import *
+from app.Controllers.Masters.OtherMasters.GstRateMasterController import *
+from app.Controllers.Transactions.OtherPurchaseController import *
+from app.Controllers.BusinessRelated.DeliveryOrder.DeliveryOrderController import *
+from app.Controllers.Masters.OtherMasters.SysytemMasterController import *
+from app.Controllers.BusinessRelated.TenderPurchase.TenderPurchaseController import *
+from app.Controllers.Transactions.DebitCreditNote.DebitCreditNoteController import *
+from app.Controllers.Reports.GLedger.GLedgerController import *
+from app.Controllers.Inword.PurchaseBill.PurchaseBillController import *
+from app.Controllers.Outword.SaleBill.SaleBillController import *
+from app.Controllers.Outword.CommissionBill.CommissionBillController import *
+from app.Controllers.Inword.OtherGSTInput.OtherGSTInputController import *
+from app.Controllers.Masters.CompanyParameters.CompanyParameterController import *
+from app.Controllers.Masters.WhatsAppURL.WhatsAppURLController import *
+from app.Controllers.Transactions.PaymentNote.PaymentNoteController import *
+from app.Controllers.BusinessRelated.Letter.LetterController import *
+from app.Controllers.Outword.UnregisterBill.UnregisterBillController import *
+from app.Controllers.Utilities.PostDate.PostDateController import *
+from app.Controllers.Masters.AccountInformation.PartyUnitMaster.PartyUnitMasterController import *
+from app.Controllers.Utilities.CompanyPrintingInfo.CompanyPrintingInfoController import *
+from app.Controllers.Inword.SugarSaleReturnPurchase.SugarSaleReturnPurchaseController import *
+from app.Controllers.Outword.SugarSaleReturnSale.SugarSaleReturnSaleController import *
+from app.Controllers.Outword.ServiceBill.ServiceBillController import *
+from app.Controllers.Transactions.ReceiptPayment.ReceiptPaymentController import *
+from app.Controllers.Transactions.UTR.UTREntryController import *
+from app.Controllers.BusinessRelated.DeliveryOrder.DeliveryOrderController import *
+
+from app.Helpers.AccountMasterHelp import *
+from app.Helpers.CityMasterHelp import *
+from app.Helpers.GroupMasterHelp import *
+from app.Helpers.GstRateMasterHelp import *
+from app.Helpers.SystemMasterHelp import *
+# from app.Helpers.GstStateMasterHelp import *
+from app.Helpers.BrandMasterHelp import *
+# from app.Helpers.TenderUtilityHelp import *
+from app.Helpers.CarporateHelp import *
+from app.Helpers.purcnohelp import *
+
+#common API Routes
+from app.Common.CommonSugarPurchaseStatusCheck import *
+from app.Common.CommonLookupCacheStats import *
+from app.Common.CommonDocumentNumbers import *
+from app.Common.CommonSqlMetrics import *
+
+
+# other routes
+from app.Controllers.BusinessRelated.CorporateSale.CorporateSaleController import *
+from app.Controllers.Masters.AccountInformation.AccountMaster.AccountMasterController import *
+
+
+#EBuySugar Routes
+from app.Controllers.EBuySugarian.EBuySugarUser.EBuySugarUserControllers import *
+
+upload_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
+
+# Ensure the upload folder exists
+if not os.path.exists(upload_folder):
+    os.makedirs(upload_folder)
+
+
+if __name__ == '__main__':
+    socketio.run(app, host='localhost', port=8080, debug=True)
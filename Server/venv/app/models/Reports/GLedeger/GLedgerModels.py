@@ -0,0 +1,41 @@
+from app import db
+class Gledger(db.Model):
+    __tablename__ = 'nt_1_Gledger'
+    TRAN_TYPE = db.Column(db.String(2),nullable=True)
+    CASHCREDIT = db.Column(db.String(2),nullable=True)
+    DOC_NO = db.Column(db.Integer,nullable=False)
+    DOC_DATE = db.Column(db.Date,nullable=True)
+    AC_CODE = db.Column(db.Integer,nullable=True)
+    UNIT_Code = db.Column(db.Integer,nullable=True)
+    NARRATION = db.Column(db.String(555),nullable=True)
+    AMOUNT = db.Column(db.Numeric(18,2),nullable=True)
+    TENDER_ID = db.Column(db.Integer,nullable=True)
+    TENDER_ID_DETAIL = db.Column(db.Integer,nullable=True)
+    VOUCHER_ID = db.Column(db.Integer,nullable=True)
+    COMPANY_CODE = db.Column(db.Integer,nullable=False)
+    YEAR_CODE = db.Column(db.Integer,nullable=False)
+    ORDER_CODE = db.Column(db.Integer,nullable=False)
+    DRCR = db.Column(db.String(1), nullable=True )
+    DRCR_HEAD = db.Column(db.Integer,nullable=True)
+    ADJUSTED_AMOUNT = db.Column(db.Numeric(18,2),nullable=True)
+    Branch_Code = db.Column(db.Integer,nullable=True)
+    SORT_TYPE = db.Column(db.String(2),nullable=True)
+    SORT_NO = db.Column(db.Integer,nullable=True)
+    ac = db.Column(db.Integer,nullable=True)
+    vc = db.Column(db.Integer,nullable=True)
+    progid = db.Column(db.Integer,nullable=True)
+    tranid = db.Column(db.Integer,nullable=True)
+    GId = db.Column(db.Integer,primary_key=True)
+    saleid = db.Column(db.Integer,nullable=True)
+
+
+class GledgerBalance(db.Model):
+    # Debit and credit totals of nt_1_Gledger per account and month, kept by app.utils.GLedgerBalance
+    __tablename__ = 'nt_1_GledgerBalance'
+    COMPANY_CODE = db.Column(db.Integer,primary_key=True)
+    YEAR_CODE = db.Column(db.Integer,primary_key=True)
+    AC_CODE = db.Column(db.Integer,primary_key=True)
+    BALANCE_MONTH = db.Column(db.Date,primary_key=True)
+    DEBIT = db.Column(db.Numeric(18,2),nullable=False,default=0)
+    CREDIT = db.Column(db.Numeric(18,2),nullable=False,default=0)
+    ENTRY_COUNT = db.Column(db.Integer,nullable=False,default=0)
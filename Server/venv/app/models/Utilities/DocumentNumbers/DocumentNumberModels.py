@@ -0,0 +1,10 @@
+from app import db
+
+class DocumentNumber(db.Model):
+    # Last number handed out per document series, kept by app.utils.DocumentNumbers
+    __tablename__ = 'nt_1_documentnumbers'
+    TABLE_NAME = db.Column(db.String(100),primary_key=True)
+    Company_Code = db.Column(db.Integer,primary_key=True)
+    Year_Code = db.Column(db.Integer,primary_key=True)
+    Tran_Type = db.Column(db.String(20),primary_key=True)
+    LAST_NO = db.Column(db.Integer,nullable=False,default=0)
@@ -0,0 +1,130 @@
+from sqlalchemy import bindparam, text
+from app import app, db
+from app.utils.LookupCache import LookupCache, invalidate_after_transaction
+
+# Master data read on every voucher save is served from process-wide caches. The
+# AccountMaster, CompanyParameter, SystemMaster and GstRate endpoints invalidate them.
+company_parameters_cache = LookupCache('company_parameters', max_entries=256, ttl_seconds=600)
+account_cache = LookupCache('accounts', max_entries=20000, ttl_seconds=600)
+item_cache = LookupCache('items', max_entries=5000, ttl_seconds=600)
+
+ACCOUNT_LOOKUP_BATCH = 1000
+
+
+def _lookup_code(value):
+    # Codes arrive both as ints and as text; '5' and 5 share one entry, and '' is 0 as SQL Server reads it
+    if isinstance(value, str) and (value.strip().lstrip('-').isdigit() or value == ''):
+        return int(value or 0)
+    return value
+
+
+def fetch_company_parameters(company_code, year_code):
+        key = (_lookup_code(company_code), _lookup_code(year_code))
+        return company_parameters_cache.get_or_load(key, lambda: _load_company_parameters(company_code, year_code))
+
+
+def _load_company_parameters(company_code, year_code):
+        query = """
+        SELECT        dbo.nt_1_companyparameters.IGSTAc, dbo.nt_1_companyparameters.SGSTAc, dbo.nt_1_companyparameters.CGSTAc, dbo.nt_1_companyparameters.PurchaseCGSTAc, dbo.nt_1_companyparameters.PurchaseSGSTAc, 
+                         dbo.nt_1_companyparameters.PurchaseIGSTAc, dbo.nt_1_companyparameters.SaleTCSAc, dbo.nt_1_companyparameters.SaleTDSAc, saleigst.accoid AS saleigstaccoid, salesgst.accoid AS salesgstaccoid, 
+                         salecgst.accoid AS salecgstaccoid, purchasecgst.accoid AS Purchasecgstaccoid, purchasesgst.accoid AS Purchasesgstaccoid, purchaseigst.accoid AS Purchaseigstaccoid, saletcs.accoid AS saletcsaccoid, 
+                         saletds.accoid AS saletdsaccoid, dbo.nt_1_companyparameters.RoundOff, dbo.nt_1_companyparameters.TransportTDS_AcCut, transporttdsaccut.Ac_Code AS transporttdscutaccode, 
+                         transporttdsaccut.accoid AS transporttdscutacid, dbo.nt_1_companyparameters.Freight_Ac, frieghtac.Ac_Code, transporttdsaccut.Ac_Name_E AS transportTDSAcname, frieghtac.Ac_Name_E AS Frieghtacname, 
+                         frieghtac.accoid AS freightAcid, dbo.nt_1_companyparameters.SELF_AC, self.Ac_Code AS selfacacode, self.Ac_Name_E AS selfacname, self.accoid AS selfacid, dbo.nt_1_companyparameters.AutoVoucher, 
+                         dbo.nt_1_companyparameters.COMMISSION_AC, commisionac.Ac_Code AS commisionaccode, commisionac.Ac_Name_E AS commisionacname, commisionac.accoid AS commisionacid, 
+                         dbo.nt_1_companyparameters.RateDiffAc, ratediffac.Ac_Code AS ratediffaccode, ratediffac.Ac_Name_E AS ratediffacname, ratediffac.accoid AS ratediffacid, dbo.nt_1_companyparameters.CGST_RCM_Ac, 
+                         dbo.nt_1_companyparameters.SGST_RCM_Ac, dbo.nt_1_companyparameters.IGST_RCM_Ac, RCMCGST.accoid AS RCMCGSTAcID, RCMSGST.accoid AS RCMSGSTacID, RCMIGST.accoid AS RCMIGSTAcID, 
+                         RCMCGST.Ac_Name_E AS RCMCGSTname, RCMSGST.Ac_Name_E AS RCMSGSTName, RCMIGST.Ac_Name_E AS RCMIGSTName
+FROM            dbo.nt_1_companyparameters INNER JOIN
+                         dbo.nt_1_accountmaster AS saleigst ON dbo.nt_1_companyparameters.IGSTAc = saleigst.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = saleigst.company_code INNER JOIN
+                         dbo.nt_1_accountmaster AS salesgst ON dbo.nt_1_companyparameters.SGSTAc = salesgst.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = salesgst.company_code INNER JOIN
+                         dbo.nt_1_accountmaster AS salecgst ON dbo.nt_1_companyparameters.CGSTAc = salecgst.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = salecgst.company_code INNER JOIN
+                         dbo.nt_1_accountmaster AS purchasecgst ON dbo.nt_1_companyparameters.PurchaseCGSTAc = purchasecgst.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = purchasecgst.company_code INNER JOIN
+                         dbo.nt_1_accountmaster AS purchasesgst ON dbo.nt_1_companyparameters.PurchaseSGSTAc = purchasesgst.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = purchasesgst.company_code INNER JOIN
+                         dbo.nt_1_accountmaster AS purchaseigst ON dbo.nt_1_companyparameters.PurchaseIGSTAc = purchaseigst.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = purchaseigst.company_code INNER JOIN
+                         dbo.nt_1_accountmaster AS saletcs ON dbo.nt_1_companyparameters.SaleTCSAc = saletcs.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = saletcs.company_code INNER JOIN
+                         dbo.nt_1_accountmaster AS saletds ON dbo.nt_1_companyparameters.SaleTDSAc = saletds.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = saletds.company_code INNER JOIN
+                         dbo.nt_1_accountmaster AS rountof ON dbo.nt_1_companyparameters.RoundOff = rountof.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = rountof.company_code INNER JOIN
+                         dbo.nt_1_accountmaster AS self ON dbo.nt_1_companyparameters.SELF_AC = self.Ac_Code LEFT OUTER JOIN
+                         dbo.nt_1_accountmaster AS RCMIGST ON dbo.nt_1_companyparameters.Company_Code = RCMIGST.company_code AND dbo.nt_1_companyparameters.IGST_RCM_Ac = RCMIGST.Ac_Code LEFT OUTER JOIN
+                         dbo.nt_1_accountmaster AS RCMSGST ON dbo.nt_1_companyparameters.Company_Code = RCMSGST.company_code AND dbo.nt_1_companyparameters.SGST_RCM_Ac = RCMSGST.Ac_Code LEFT OUTER JOIN
+                         dbo.nt_1_accountmaster AS RCMCGST ON dbo.nt_1_companyparameters.Company_Code = RCMCGST.company_code AND dbo.nt_1_companyparameters.CGST_RCM_Ac = RCMCGST.Ac_Code LEFT OUTER JOIN
+                         dbo.nt_1_accountmaster AS ratediffac ON dbo.nt_1_companyparameters.Company_Code = ratediffac.company_code AND dbo.nt_1_companyparameters.RateDiffAc = ratediffac.Ac_Code LEFT OUTER JOIN
+                         dbo.nt_1_accountmaster AS commisionac ON dbo.nt_1_companyparameters.Company_Code = commisionac.company_code AND dbo.nt_1_companyparameters.COMMISSION_AC = commisionac.Ac_Code LEFT OUTER JOIN
+                         dbo.nt_1_accountmaster AS frieghtac ON dbo.nt_1_companyparameters.Company_Code = frieghtac.company_code AND dbo.nt_1_companyparameters.Freight_Ac = frieghtac.Ac_Code LEFT OUTER JOIN
+                         dbo.nt_1_accountmaster AS transporttdsaccut ON dbo.nt_1_companyparameters.TransportTDS_Ac = transporttdsaccut.Ac_Code AND dbo.nt_1_companyparameters.Company_Code = transporttdsaccut.company_code
+          WHERE dbo.nt_1_companyparameters.Company_Code = :company_code AND dbo.nt_1_companyparameters.Year_Code = :year_code
+        """
+        result = db.session.execute(text(query), {'company_code': company_code, 'year_code': year_code}).fetchone()
+        return result
+
+
+def _load_accounts(keys):
+        rows = {}
+        for company_code in {key[0] for key in keys}:
+            ac_codes = [key[1] for key in keys if key[0] == company_code]
+            for start in range(0, len(ac_codes), ACCOUNT_LOOKUP_BATCH):
+                result = db.session.execute(
+                    text("SELECT Ac_Code, accoid, Short_Name FROM nt_1_accountmaster WHERE Ac_Code IN :ac_codes and company_code= :company_code ORDER BY accoid")
+                    .bindparams(bindparam('ac_codes', expanding=True)),
+                    {'ac_codes': ac_codes[start:start + ACCOUNT_LOOKUP_BATCH], 'company_code': company_code}
+                )
+                for row in result:
+                    # The lowest accoid wins, as with the single-code lookups
+                    rows.setdefault((company_code, _lookup_code(row.Ac_Code)), (row.accoid, row.Short_Name))
+        return rows
+
+
+def _account(ac_code, company_code):
+        key = (_lookup_code(company_code), _lookup_code(ac_code))
+        return account_cache.get_many([key], _load_accounts)[key]
+
+
+def get_accoids(ac_codes, company_code):
+        """Return {ac_code: accoid} for all `ac_codes`, reading the uncached ones in one query."""
+        keys = {ac_code: (_lookup_code(company_code), _lookup_code(ac_code)) for ac_code in ac_codes if ac_code is not None}
+        accounts = account_cache.get_many(set(keys.values()), _load_accounts)
+        return {ac_code: accounts[key][0] if accounts[key] else None for ac_code, key in keys.items()}
+
+
+def get_accoid(ac_code,company_code):
+        account = _account(ac_code, company_code)
+        return account[0] if account else None
+
+
+def _item_accounts(ic):
+        key = (_lookup_code(ic),)
+        return item_cache.get_or_load(key, lambda: db.session.execute(
+            text("select Purchase_AC, Sale_AC from nt_1_systemmaster where systemid =:ic"),
+            {'ic': ic}
+        ).fetchone())
+
+
+def getPurchaseAc(ic):
+    print("ic", ic)
+    result = _item_accounts(ic)
+    return result.Purchase_AC if result else None
+
+def getSaleAc(ic):
+    print("ic", ic)
+    result = _item_accounts(ic)
+    return result.Sale_AC if result else None
+
+def get_acShort_Name(ac_code,company_code):
+        print("company_code",company_code)
+        account = _account(ac_code, company_code)
+        return account[1] if account else None
+
+
+def invalidate_account_lookups(company_code):
+        # Company parameters carry account ids and names, so they are dropped as well
+        invalidate_after_transaction(db.session, account_cache, _lookup_code(company_code))
+        invalidate_after_transaction(db.session, company_parameters_cache, _lookup_code(company_code))
+
+
+def invalidate_company_parameters(company_code):
+        invalidate_after_transaction(db.session, company_parameters_cache, _lookup_code(company_code))
+
+
+def invalidate_item_lookups():
+        invalidate_after_transaction(db.session, item_cache)
@@ -0,0 +1,138 @@
+from sqlalchemy import case, delete, insert, literal, update
+from app import db
+
+# Saves the detail grid of a voucher in set-based statements instead of one ORM add,
+# update or delete per row. The grid rows carry rowaction "add", "update" or "delete":
+#   add     one INSERT ... RETURNING for all rows (insertmanyvalues), the generated ids come back
+#   update  rows changing the same columns are written together with
+#           UPDATE ... SET col = CASE id WHEN ... END WHERE id IN (...)
+#   delete  one DELETE ... WHERE id IN (...) RETURNING id
+# Rows without a rowaction are left alone. The caller's row dicts are not modified.
+
+# SQL Server accepts at most 2100 parameters per statement
+MAX_PARAMETERS = 2000
+
+
+class DetailChanges:
+    def __init__(self):
+        # Model instances of the inserted rows, in grid order
+        self.added = []
+        # The inserted values (without rowaction) plus the generated key, in grid order
+        self.added_rows = []
+        self.updated = []
+        self.deleted = []
+
+
+class DetailSync:
+    """Applies rowaction-tagged grid rows to the detail `model`, whose primary key attribute is `key`.
+
+    `update_exclude` names further fields that are never written by an update, e.g. the head id.
+    """
+
+    def __init__(self, model, key, update_exclude=()):
+        self.model = model
+        self.key = key
+        self.table = model.__table__
+        mapper = model.__mapper__
+        # Attribute name -> table column, for the attributes mapped to a single column
+        self.columns = {attr.key: attr.columns[0] for attr in mapper.column_attrs if len(attr.columns) == 1}
+        self.key_column = self.columns[key]
+        self.update_exclude = {key, 'rowaction'} | set(update_exclude)
+
+    def _check_fields(self, values):
+        for name in values:
+            if name not in self.columns:
+                raise TypeError(f"{name!r} is an invalid keyword argument for {self.model.__name__}")
+
+    def apply(self, rows, add_values=None, update_values=None):
+        """Write the rows; `add_values` / `update_values` are set on every added / updated row. Does not commit."""
+        changes = DetailChanges()
+        added, updated, deleted = [], [], []
+        for row in rows:
+            action = row.get('rowaction')
+            if action == "add":
+                values = {name: value for name, value in row.items() if name != 'rowaction'}
+                values.update(add_values or {})
+                if values.get(self.key) is None:
+                    # Left to the database, as the ORM does for an unset key
+                    values.pop(self.key, None)
+                added.append(values)
+            elif action == "update":
+                values = {name: value for name, value in row.items() if name not in self.update_exclude}
+                values.update(update_values or {})
+                updated.append((row[self.key], values))
+            elif action == "delete":
+                deleted.append(row[self.key])
+
+        # Pending head rows (and their ids) must reach the database before the details
+        db.session.flush()
+        if added:
+            self._insert(added, changes)
+        if updated:
+            self._update(updated, changes)
+        if deleted:
+            self._delete(deleted, changes)
+        return changes
+
+    def _insert(self, added, changes):
+        for values in added:
+            self._check_fields(values)
+        statement = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        changes.added = db.session.scalars(statement, added).all()
+        for values, instance in zip(added, changes.added):
+            changes.added_rows.append(dict(values, **{self.key: getattr(instance, self.key)}))
+
+    def _update(self, updated, changes):
+        # Rows that change the same columns share one statement
+        groups = {}
+        for key_value, values in updated:
+            self._check_fields(values)
+            groups.setdefault(tuple(sorted(values)), []).append((key_value, values))
+            changes.updated.append(key_value)
+
+        for names, group in groups.items():
+            if not names:
+                continue
+            chunk_size = max(1, MAX_PARAMETERS // (2 * len(names) + 1))
+            for start in range(0, len(group), chunk_size):
+                chunk = group[start:start + chunk_size]
+                if len(chunk) == 1:
+                    key_value, values = chunk[0]
+                    statement = update(self.table).where(self.key_column == key_value).values(
+                        {self.columns[name]: values[name] for name in names}
+                    )
+                else:
+                    statement = update(self.table).where(self.key_column.in_([key_value for key_value, _ in chunk])).values({
+                        self.columns[name]: case(
+                            {key_value: literal(values[name], self.columns[name].type) for key_value, values in chunk},
+                            value=self.key_column,
+                            else_=self.columns[name]
+                        )
+                        for name in names
+                    })
+                db.session.execute(statement)
+        self._expire([key_value for key_value, _ in updated])
+
+    def _delete(self, deleted, changes):
+        removed = set()
+        for start in range(0, len(deleted), MAX_PARAMETERS):
+            chunk = deleted[start:start + MAX_PARAMETERS]
+            statement = delete(self.table).where(self.key_column.in_(chunk)).returning(self.key_column)
+            removed.update(str(key_value) for key_value in db.session.execute(statement).scalars().all())
+        # Only the rows that still existed, as the controllers reported them
+        changes.deleted = [key_value for key_value in deleted if str(key_value) in removed]
+        self._expire(changes.deleted, forget=True)
+
+    def _expire(self, key_values, forget=False):
+        # Instances loaded earlier in the session no longer match the table
+        for key_value in key_values:
+            try:
+                instance = db.session.identity_map.get(db.session.identity_key(self.model, int(key_value)))
+            except (TypeError, ValueError):
+                continue
+            if instance is None:
+                continue
+            if forget:
+                db.session.expunge(instance)
+            else:
+                db.session.expire(instance)
@@ -0,0 +1,124 @@
+from sqlalchemy import and_, func, select
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.Utilities.DocumentNumbers.DocumentNumberModels import DocumentNumber
+
+# Document numbers handed out from the counter table nt_1_documentnumbers, one row per
+# series (TABLE_NAME, Company_Code, Year_Code, Tran_Type), instead of SELECT MAX(doc_no) + 1.
+# A number is reserved with a single UPDATE ... SET LAST_NO = LAST_NO + n ... RETURNING in the
+# document's own transaction: the counter row stays locked until the document commits, so two
+# saves of the same series cannot get the same number, and a save that rolls back gives its
+# numbers back. A series without a counter row starts after the highest number already stored.
+#
+# Numbers written by anything other than these series (imports, other programs) are not seen
+# by the counters; afterwards run
+#     flask --app run doc-numbers sync <Company_Code>
+
+counter_table = DocumentNumber.__table__
+COUNTER_KEY_COLUMNS = ('TABLE_NAME', 'Company_Code', 'Year_Code', 'Tran_Type')
+
+_series = {}
+
+
+def _counter_filter(key):
+    return and_(*(counter_table.c[name] == key[name] for name in COUNTER_KEY_COLUMNS))
+
+
+class DocumentSeries:
+    """Numbers of `number_column`, counted per company, year and tran_type.
+
+    Any of the scope columns may be None when the table has no such column; the series
+    is then not split by it. The tran_type scope may be any value, e.g. the tenderid of
+    the tender detail IDs.
+    """
+
+    def __init__(self, number_column, company_column=None, year_column=None, tran_type_column=None, name=None):
+        self.number_column = number_column
+        self.company_column = company_column
+        self.year_column = year_column
+        self.tran_type_column = tran_type_column
+        self.name = name or number_column.table.name
+        _series[self.name] = self
+
+    def _key(self, company_code, year_code, tran_type):
+        return {
+            'TABLE_NAME': self.name,
+            'Company_Code': int(company_code or 0) if self.company_column is not None else 0,
+            'Year_Code': int(year_code or 0) if self.year_column is not None else 0,
+            'Tran_Type': str(tran_type or '') if self.tran_type_column is not None else ''
+        }
+
+    def current_max(self, company_code=None, year_code=None, tran_type=None):
+        """Highest number stored in the document table for this scope, 0 when there is none."""
+        conditions = []
+        for column, value in ((self.company_column, company_code), (self.year_column, year_code), (self.tran_type_column, tran_type)):
+            if column is not None:
+                conditions.append(column == value)
+        # Some document tables keep the number in a Numeric column
+        return int(db.session.execute(select(func.max(self.number_column)).where(*conditions)).scalar() or 0)
+
+    def reserve(self, company_code=None, year_code=None, tran_type=None, count=1):
+        """Reserve `count` consecutive numbers and return the first one. Does not commit."""
+        if count < 1:
+            raise ValueError("count must be positive")
+        key = self._key(company_code, year_code, tran_type)
+        increment = counter_table.update().where(_counter_filter(key)).values(
+            LAST_NO=counter_table.c.LAST_NO + count
+        ).returning(counter_table.c.LAST_NO)
+
+        last_no = db.session.execute(increment).scalar()
+        if last_no is None:
+            last_no = self.current_max(company_code, year_code, tran_type) + count
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(counter_table.insert().values(**key, LAST_NO=last_no))
+            except IntegrityError:
+                # Another transaction started the series first
+                last_no = db.session.execute(increment).scalar()
+        return last_no - count + 1
+
+    def next(self, company_code=None, year_code=None, tran_type=None):
+        return self.reserve(company_code, year_code, tran_type)
+
+    def peek(self, company_code=None, year_code=None, tran_type=None):
+        """The number the next reserve() would return, without reserving it."""
+        last_no = db.session.execute(
+            select(counter_table.c.LAST_NO).where(_counter_filter(self._key(company_code, year_code, tran_type)))
+        ).scalar()
+        if last_no is None:
+            last_no = self.current_max(company_code, year_code, tran_type)
+        return last_no + 1
+
+
+def _counter_rows(company_code):
+    statement = select(counter_table).where(
+        counter_table.c.Company_Code == company_code
+    ).order_by(*(counter_table.c[name] for name in COUNTER_KEY_COLUMNS))
+    return db.session.execute(statement).mappings().all()
+
+
+def check_document_numbers(company_code):
+    """List the counters of the company that are behind the highest number stored."""
+    company_code = int(company_code)
+    behind = []
+    rows = _counter_rows(company_code)
+    for row in rows:
+        series = _series.get(row['TABLE_NAME'])
+        if series is None:
+            continue
+        year_code = row['Year_Code'] if series.year_column is not None else None
+        tran_type = row['Tran_Type'] if series.tran_type_column is not None else None
+        stored_max = series.current_max(company_code, year_code, tran_type)
+        if stored_max > row['LAST_NO']:
+            behind.append(dict(row, STORED_MAX=stored_max))
+    return {'checked': len(rows), 'behind': behind}
+
+
+def sync_document_numbers(company_code):
+    """Move the counters that are behind up to the highest number stored. Does not commit."""
+    result = check_document_numbers(company_code)
+    for row in result['behind']:
+        db.session.execute(counter_table.update().where(_counter_filter(row)).where(
+            counter_table.c.LAST_NO < row['STORED_MAX']
+        ).values(LAST_NO=row['STORED_MAX']))
+    return result
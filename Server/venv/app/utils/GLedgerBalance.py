@@ -0,0 +1,248 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import and_, bindparam, func, select
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.Reports.GLedeger.GLedgerModels import Gledger, GledgerBalance
+
+# Debit and credit totals of nt_1_Gledger per (COMPANY_CODE, YEAR_CODE, AC_CODE) and month.
+# post_gledger_entries and delete_gledger_entries hand the rows they add and remove to
+# apply_balance_changes() inside the voucher's transaction, so the balance of an account up
+# to any date is the sum of its month rows plus at most one partial month of nt_1_Gledger.
+# Rows without a DOC_DATE are kept under UNDATED_MONTH, before every real month.
+#
+# After creating the table (or after rows were written outside the posting engine) run
+#     flask --app run gledger-balance rebuild <Company_Code> [--year <Year_Code>]
+
+gledger_table = Gledger.__table__
+balance_table = GledgerBalance.__table__
+ZERO = Decimal('0.00')
+UNDATED_MONTH = date(1900, 1, 1)
+BALANCE_KEY_COLUMNS = ('COMPANY_CODE', 'YEAR_CODE', 'AC_CODE', 'BALANCE_MONTH')
+REBUILD_BATCH_SIZE = 1000
+
+
+def month_start(value):
+    return UNDATED_MONTH if value is None else value.replace(day=1)
+
+
+def debit_credit(drcr, amount):
+    amount = amount or ZERO
+    drcr = (drcr or '').upper()
+    if drcr == 'D':
+        return amount, ZERO
+    if drcr == 'C':
+        return ZERO, amount
+    return ZERO, ZERO
+
+
+def _new_totals():
+    return defaultdict(lambda: [ZERO, ZERO, 0])
+
+
+def _balance_filter(key):
+    return and_(*(balance_table.c[name] == key[name] for name in BALANCE_KEY_COLUMNS))
+
+
+# Built once; a posting runs it for every month it changes
+_BALANCE_UPDATE = balance_table.update().where(
+    *(balance_table.c[name] == bindparam(f'key_{name}', type_=balance_table.c[name].type) for name in BALANCE_KEY_COLUMNS)
+).values(
+    DEBIT=balance_table.c.DEBIT + bindparam('add_debit', type_=balance_table.c.DEBIT.type),
+    CREDIT=balance_table.c.CREDIT + bindparam('add_credit', type_=balance_table.c.CREDIT.type),
+    ENTRY_COUNT=balance_table.c.ENTRY_COUNT + bindparam('add_count', type_=balance_table.c.ENTRY_COUNT.type)
+)
+
+
+def _update_month(key, debit, credit, count):
+    """Add to the totals of one month row; returns the number of rows updated (0 when it does not exist)."""
+    parameters = {f'key_{name}': key[name] for name in BALANCE_KEY_COLUMNS}
+    parameters.update(add_debit=debit, add_credit=credit, add_count=count)
+    return db.session.execute(_BALANCE_UPDATE, parameters).rowcount
+
+
+def _stored_months(keys):
+    # The month rows among `keys` that exist, one read per company and year
+    scopes = defaultdict(list)
+    for key in keys:
+        scopes[key[:2]].append(key)
+    stored = set()
+    for (company_code, year_code), scope_keys in scopes.items():
+        statement = select(balance_table.c.AC_CODE, balance_table.c.BALANCE_MONTH).where(
+            balance_table.c.COMPANY_CODE == company_code,
+            balance_table.c.YEAR_CODE == year_code,
+            balance_table.c.AC_CODE.in_({key[2] for key in scope_keys}),
+            balance_table.c.BALANCE_MONTH.in_({key[3] for key in scope_keys})
+        )
+        stored.update((company_code, year_code, ac_code, month) for ac_code, month in db.session.execute(statement).all())
+    return stored
+
+
+def apply_balance_changes(added_rows, removed_rows):
+    """Add `added_rows` to and subtract `removed_rows` from the month totals. Does not commit."""
+    totals = _new_totals()
+    for rows, sign in ((added_rows, 1), (removed_rows, -1)):
+        for row in rows:
+            key = (row['COMPANY_CODE'], row['YEAR_CODE'], row['AC_CODE'] or 0, month_start(row['DOC_DATE']))
+            debit, credit = debit_credit(row['DRCR'], row['AMOUNT'])
+            total = totals[key]
+            total[0] += sign * debit
+            total[1] += sign * credit
+            total[2] += sign
+
+    changes = [(key, total) for key, total in sorted(totals.items()) if any(total)]
+    # Months that gain rows may not exist yet; one read finds the stored ones, so a new
+    # month is inserted without trying an UPDATE first (the first posting of an account
+    # in a month, e.g. every row of a new voucher's first save)
+    stored = _stored_months([key for key, (_, _, count) in changes if count > 0])
+
+    # A fixed order keeps concurrent postings from locking the same months in opposite order
+    new_months = []
+    emptied_months = []
+    for key, (debit, credit, count) in changes:
+        month_exists = count <= 0 or key in stored
+        key = dict(zip(BALANCE_KEY_COLUMNS, key))
+        if not month_exists or _update_month(key, debit, credit, count) == 0:
+            new_months.append(dict(key, DEBIT=debit, CREDIT=credit, ENTRY_COUNT=count))
+        elif count < 0:
+            emptied_months.append(key)
+
+    if new_months:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(balance_table.insert(), new_months)
+        except IntegrityError:
+            # Another transaction added one of the months first
+            for month in new_months:
+                key = {name: month[name] for name in BALANCE_KEY_COLUMNS}
+                if _update_month(key, month['DEBIT'], month['CREDIT'], month['ENTRY_COUNT']) == 0:
+                    db.session.execute(balance_table.insert().values(**month))
+    for key in emptied_months:
+        db.session.execute(balance_table.delete().where(_balance_filter(key), balance_table.c.ENTRY_COUNT == 0))
+
+
+def account_totals(company_code, year_code, before_date=None, ac_codes=None):
+    """{AC_CODE: (debit, credit)} of the rows dated before `before_date` (all rows when None).
+
+    Undated rows are always included.
+    """
+    conditions = [balance_table.c.COMPANY_CODE == company_code, balance_table.c.YEAR_CODE == year_code]
+    if ac_codes is not None:
+        conditions.append(balance_table.c.AC_CODE.in_(ac_codes))
+    first_day = None if before_date is None else month_start(before_date)
+    if first_day is not None:
+        conditions.append(balance_table.c.BALANCE_MONTH < first_day)
+
+    totals = {}
+    statement = select(
+        balance_table.c.AC_CODE, func.sum(balance_table.c.DEBIT), func.sum(balance_table.c.CREDIT)
+    ).where(*conditions).group_by(balance_table.c.AC_CODE)
+    for ac_code, debit, credit in db.session.execute(statement).all():
+        totals[ac_code] = (debit or ZERO, credit or ZERO)
+
+    if first_day is not None and before_date > first_day:
+        # The days of the last month that are not covered by a whole month row
+        conditions = [
+            gledger_table.c.COMPANY_CODE == company_code,
+            gledger_table.c.YEAR_CODE == year_code,
+            gledger_table.c.DOC_DATE >= first_day,
+            gledger_table.c.DOC_DATE < before_date
+        ]
+        if ac_codes is not None:
+            conditions.append(gledger_table.c.AC_CODE.in_(ac_codes))
+        statement = select(
+            func.coalesce(gledger_table.c.AC_CODE, 0), gledger_table.c.DRCR, func.sum(gledger_table.c.AMOUNT)
+        ).where(*conditions).group_by(func.coalesce(gledger_table.c.AC_CODE, 0), gledger_table.c.DRCR)
+        for ac_code, drcr, amount in db.session.execute(statement).all():
+            debit, credit = debit_credit(drcr, amount)
+            previous_debit, previous_credit = totals.get(ac_code, (ZERO, ZERO))
+            totals[ac_code] = (previous_debit + debit, previous_credit + credit)
+    return totals
+
+
+def _scope(table, company_code, year_code):
+    conditions = [table.c.COMPANY_CODE == company_code]
+    if year_code is not None:
+        conditions.append(table.c.YEAR_CODE == year_code)
+    return conditions
+
+
+def _ledger_month_totals(company_code, year_code):
+    # Summed per day in the database, folded into months here
+    statement = select(
+        gledger_table.c.YEAR_CODE,
+        func.coalesce(gledger_table.c.AC_CODE, 0).label('AC_CODE'),
+        gledger_table.c.DOC_DATE,
+        gledger_table.c.DRCR,
+        func.sum(gledger_table.c.AMOUNT).label('AMOUNT'),
+        func.count().label('ENTRY_COUNT')
+    ).where(*_scope(gledger_table, company_code, year_code)).group_by(
+        gledger_table.c.YEAR_CODE, func.coalesce(gledger_table.c.AC_CODE, 0), gledger_table.c.DOC_DATE, gledger_table.c.DRCR
+    )
+    totals = _new_totals()
+    for row in db.session.execute(statement).all():
+        debit, credit = debit_credit(row.DRCR, row.AMOUNT)
+        total = totals[(company_code, row.YEAR_CODE, row.AC_CODE, month_start(row.DOC_DATE))]
+        total[0] += debit
+        total[1] += credit
+        total[2] += row.ENTRY_COUNT
+    return totals
+
+
+def _stored_month_totals(company_code, year_code):
+    statement = select(balance_table).where(*_scope(balance_table, company_code, year_code))
+    return {
+        tuple(row[name] for name in BALANCE_KEY_COLUMNS): [row['DEBIT'], row['CREDIT'], row['ENTRY_COUNT']]
+        for row in db.session.execute(statement).mappings().all()
+    }
+
+
+def _totals_dict(total):
+    if total is None:
+        return None
+    return {'DEBIT': total[0], 'CREDIT': total[1], 'ENTRY_COUNT': total[2]}
+
+
+def verify_gledger_balances(company_code, year_code=None):
+    """Recompute the month totals from nt_1_Gledger and list the month rows that differ."""
+    company_code = int(company_code)
+    year_code = None if year_code is None else int(year_code)
+    expected = _ledger_month_totals(company_code, year_code)
+    stored = _stored_month_totals(company_code, year_code)
+
+    differences = []
+    for key in sorted(set(expected) | set(stored)):
+        expected_total = expected.get(key)
+        stored_total = stored.get(key)
+        if expected_total != stored_total:
+            differences.append(dict(
+                zip(BALANCE_KEY_COLUMNS, key),
+                expected=_totals_dict(expected_total),
+                stored=_totals_dict(stored_total)
+            ))
+    return {'months': len(expected), 'differences': differences}
+
+
+def rebuild_gledger_balances(company_code, year_code=None):
+    """Rewrite the month rows that differ from nt_1_Gledger. Does not commit.
+
+    Postings of the company committed while the rebuild runs may be missed; run
+    verify_gledger_balances afterwards when the company is not idle.
+    """
+    result = verify_gledger_balances(company_code, year_code)
+    keys_to_delete = []
+    rows_to_insert = []
+    for difference in result['differences']:
+        key = {name: difference[name] for name in BALANCE_KEY_COLUMNS}
+        if difference['stored'] is not None:
+            keys_to_delete.append(key)
+        if difference['expected'] is not None:
+            rows_to_insert.append(dict(key, **difference['expected']))
+
+    for key in keys_to_delete:
+        db.session.execute(balance_table.delete().where(_balance_filter(key)))
+    for start in range(0, len(rows_to_insert), REBUILD_BATCH_SIZE):
+        db.session.execute(balance_table.insert(), rows_to_insert[start:start + REBUILD_BATCH_SIZE])
+
+    return {'months': result['months'], 'deleted': len(keys_to_delete), 'inserted': len(rows_to_insert)}
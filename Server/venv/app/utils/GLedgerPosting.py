@@ -0,0 +1,170 @@
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from sqlalchemy import select
+from app import db
+from app.models.Reports.GLedeger.GLedgerModels import Gledger
+from app.utils.GLedgerBalance import apply_balance_changes
+
+# In-process posting of GLedger rows for one document (COMPANY_CODE, DOC_NO, YEAR_CODE, TRAN_TYPE).
+# Callers run it inside their own session transaction and commit (or roll back) together with the voucher.
+# The account month totals (app.utils.GLedgerBalance) are updated in the same transaction.
+
+gledger_table = Gledger.__table__
+AMOUNT_PLACES = Decimal('0.01')
+
+# Vouchers send ISO dates; opening balances use the SQL Server month/day/year form
+DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%a, %d %b %Y %H:%M:%S GMT')
+
+# Every column except the identity key takes part in the comparison of new and stored rows
+POSTING_COLUMNS = [column for column in gledger_table.columns if column.key != 'GId']
+POSTING_COLUMN_KEYS = [column.key for column in POSTING_COLUMNS]
+
+
+class GLedgerPostingError(ValueError):
+    pass
+
+
+class GLedgerBalanceError(GLedgerPostingError):
+    pass
+
+
+def _parse_date(value):
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value[:10] if date_format == '%Y-%m-%d' else value, date_format).date()
+        except ValueError:
+            continue
+    raise GLedgerPostingError(f"Invalid DOC_DATE: {value!r}")
+
+
+def _normalize_value(column, value):
+    python_type = column.type.python_type
+    if value is None:
+        return None
+    if value == '':
+        # SQL Server stores '' as 0 in integer columns
+        return 0 if python_type is int else None
+    if python_type is date:
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return _parse_date(str(value))
+    if python_type is Decimal:
+        try:
+            return Decimal(str(value)).quantize(AMOUNT_PLACES)
+        except InvalidOperation:
+            raise GLedgerPostingError(f"Invalid amount for {column.key}: {value!r}")
+    if python_type is int:
+        return int(value)
+    return str(value)
+
+
+def normalize_gledger_entry(entry, company_code, doc_no, year_code, tran_type):
+    unknown_keys = set(entry) - set(POSTING_COLUMN_KEYS) - {'GId'}
+    if unknown_keys:
+        raise GLedgerPostingError(f"Unknown GLedger fields: {', '.join(sorted(unknown_keys))}")
+
+    record = dict(entry)
+    record['COMPANY_CODE'] = company_code
+    record['DOC_NO'] = doc_no
+    record['YEAR_CODE'] = year_code
+    record['TRAN_TYPE'] = tran_type
+    return {column.key: _normalize_value(column, record.get(column.key)) for column in POSTING_COLUMNS}
+
+
+def check_gledger_balance(entries):
+    debit = Decimal('0.00')
+    credit = Decimal('0.00')
+    for entry in entries:
+        amount = _normalize_value(gledger_table.c.AMOUNT, entry.get('AMOUNT')) or Decimal('0.00')
+        drcr = (entry.get('DRCR') or '').upper()
+        if drcr == 'D':
+            debit += amount
+        elif drcr == 'C':
+            credit += amount
+        else:
+            raise GLedgerBalanceError(f"Invalid DRCR value: {entry.get('DRCR')!r}")
+
+    if debit != credit:
+        raise GLedgerBalanceError(f"GLedger entries are not balanced: debit {debit} credit {credit}")
+    return debit, credit
+
+
+def _document_filter(company_code, doc_no, year_code, tran_type):
+    return (
+        (gledger_table.c.COMPANY_CODE == company_code) &
+        (gledger_table.c.DOC_NO == doc_no) &
+        (gledger_table.c.YEAR_CODE == year_code) &
+        (gledger_table.c.TRAN_TYPE == tran_type)
+    )
+
+
+def _row_key(row):
+    return tuple(row[key] for key in POSTING_COLUMN_KEYS)
+
+
+def post_gledger_entries(company_code, doc_no, year_code, tran_type, entries, check_balance=False, new_document=False):
+    """Replace the GLedger rows of one document with `entries`.
+
+    Only the difference is written: stored rows that match a new row are kept,
+    the rest are removed with one DELETE ... WHERE GId IN (...) and the missing
+    rows are added with one executemany INSERT. Does not commit.
+
+    Insert paths whose document number was just reserved from its counter pass
+    `new_document`: the document has no stored rows, so they are not read.
+    """
+    company_code = int(company_code)
+    doc_no = int(doc_no)
+    year_code = int(year_code)
+    tran_type = str(tran_type)
+
+    new_rows = [normalize_gledger_entry(entry, company_code, doc_no, year_code, tran_type) for entry in entries]
+    if check_balance:
+        check_gledger_balance(new_rows)
+
+    existing_rows = [] if new_document else db.session.execute(
+        select(gledger_table.c.GId, *POSTING_COLUMNS).where(_document_filter(company_code, doc_no, year_code, tran_type))
+    ).mappings().all()
+
+    stored_rows = {}
+    stored_ids_by_key = defaultdict(list)
+    for row in existing_rows:
+        normalized_row = {column.key: _normalize_value(column, row[column.key]) for column in POSTING_COLUMNS}
+        stored_rows[row['GId']] = normalized_row
+        stored_ids_by_key[_row_key(normalized_row)].append(row['GId'])
+
+    rows_to_insert = []
+    for row in new_rows:
+        stored_ids = stored_ids_by_key.get(_row_key(row))
+        if stored_ids:
+            stored_ids.pop()
+        else:
+            rows_to_insert.append(row)
+
+    ids_to_delete = [gid for stored_ids in stored_ids_by_key.values() for gid in stored_ids]
+
+    if ids_to_delete:
+        db.session.execute(gledger_table.delete().where(gledger_table.c.GId.in_(ids_to_delete)))
+    if rows_to_insert:
+        db.session.execute(gledger_table.insert(), rows_to_insert)
+    apply_balance_changes(rows_to_insert, [stored_rows[gid] for gid in ids_to_delete])
+
+    return {
+        'inserted': len(rows_to_insert),
+        'deleted': len(ids_to_delete),
+        'unchanged': len(new_rows) - len(rows_to_insert)
+    }
+
+
+def delete_gledger_entries(company_code, doc_no, year_code, tran_type):
+    """Remove all GLedger rows of one document with a single DELETE. Does not commit."""
+    document_filter = _document_filter(int(company_code), int(doc_no), int(year_code), str(tran_type))
+    removed_rows = db.session.execute(
+        select(gledger_table.c.COMPANY_CODE, gledger_table.c.YEAR_CODE, gledger_table.c.AC_CODE,
+               gledger_table.c.DOC_DATE, gledger_table.c.DRCR, gledger_table.c.AMOUNT).where(document_filter)
+    ).mappings().all()
+    result = db.session.execute(gledger_table.delete().where(document_filter))
+    apply_balance_changes([], removed_rows)
+    return result.rowcount
@@ -0,0 +1,276 @@
+import bisect
+import re
+import threading
+import time
+import uuid
+from flask import jsonify, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# In-memory search indexes behind the Help lookup endpoints. Each HelpList keeps one
+# index per scope (company code first, e.g. (Company_Code,) or (CompanyCode, SystemType));
+# the rows are read once and then kept current from the master endpoints, which report
+# the keys they changed with mark_help_changed(). An index is also re-read after
+# HELP_INDEX_MAX_AGE seconds so rows written outside the API are picked up.
+#
+# Query arguments understood by every Help endpoint using help_response():
+#   search=<text> [&limit=<n>]   ranked matches only (code, then prefix, then token, then substring)
+#   since=<version>              only the rows changed since that version, plus the deleted keys
+# The full list is sent with an ETag; a matching If-None-Match gets 304 Not Modified.
+
+HELP_INDEX_MAX_AGE = 300
+HELP_SEARCH_LIMIT = 20
+MAX_HELP_SEARCH_LIMIT = 500
+
+TOKEN_PATTERN = re.compile(r'[0-9a-z]+')
+
+# Search ranks, best first
+RANK_CODE = 0
+RANK_CODE_PREFIX = 1
+RANK_NAME_PREFIX = 2
+RANK_TOKEN_PREFIX = 3
+RANK_SUBSTRING = 4
+
+_help_lists = {}
+
+
+def _text(value):
+    return '' if value is None else str(value).strip().lower()
+
+
+class _HelpIndex:
+    def __init__(self, help_list, scope):
+        self.help_list = help_list
+        self.scope = scope
+        # Distinguishes versions handed out before a restart (or by another worker)
+        self.instance = uuid.uuid4().hex[:8]
+        self.version = 0
+        self.loaded_at = None
+        self.reload_all = True
+        self.pending_keys = set()
+        self.rows = {}
+        self.order = []
+        self.positions = {}
+        self.changed_at = {}
+        self.deleted_at = {}
+        self.tokens = []
+        self.row_tokens = {}
+        self.row_text = {}
+        self.lock = threading.Lock()
+
+    # -- maintenance -------------------------------------------------------
+
+    def refresh(self):
+        with self.lock:
+            stale = self.loaded_at is None or time.monotonic() - self.loaded_at > self.help_list.max_age
+            if self.reload_all or stale:
+                self._apply(self.help_list.load_rows(self.scope, None), None)
+                self.loaded_at = time.monotonic()
+                self.reload_all = False
+                self.pending_keys.clear()
+            elif self.pending_keys:
+                keys = list(self.pending_keys)
+                self.pending_keys.clear()
+                self._apply(self.help_list.load_rows(self.scope, keys), keys)
+
+    def _apply(self, loaded_rows, keys):
+        """Merge freshly read rows; `keys` limits the merge to those keys (None = whole list)."""
+        key_field = self.help_list.key
+        loaded = {row[key_field]: row for row in loaded_rows}
+        candidates = set(loaded) | (set(self.rows) if keys is None else set(keys))
+        next_version = self.version + 1
+        changed = False
+
+        for key in candidates:
+            row = loaded.get(key)
+            if row is None:
+                if key in self.rows:
+                    self._unindex(key)
+                    del self.rows[key]
+                    self.changed_at.pop(key, None)
+                    self.deleted_at[key] = next_version
+                    changed = True
+            elif self.rows.get(key) != row:
+                if key in self.rows:
+                    self._unindex(key)
+                self.rows[key] = row
+                self._index(key, row)
+                self.changed_at[key] = next_version
+                self.deleted_at.pop(key, None)
+                changed = True
+
+        if keys is None:
+            # A full read brings the database order
+            self.order = [row[key_field] for row in loaded_rows]
+        elif changed:
+            order = [key for key in self.order if key in self.rows]
+            order.extend(key for key in loaded if key not in self.positions)
+            if self.help_list.sort_key is not None:
+                order.sort(key=lambda key: self.help_list.sort_key(self.rows[key]), reverse=self.help_list.reverse)
+            self.order = order
+        if changed or keys is None:
+            self.positions = {key: position for position, key in enumerate(self.order)}
+        if changed:
+            self.version = next_version
+
+    def _index(self, key, row):
+        tokens = set()
+        for field in self.help_list.name_fields + self.help_list.code_fields:
+            tokens.update(TOKEN_PATTERN.findall(_text(row.get(field))))
+        for field in self.help_list.code_fields:
+            value = _text(row.get(field))
+            if value:
+                tokens.add(value)
+        self.row_tokens[key] = tokens
+        self.row_text[key] = ' '.join(_text(row.get(field)) for field in self.help_list.name_fields + self.help_list.code_fields)
+        for token in tokens:
+            bisect.insort(self.tokens, (token, key))
+
+    def _unindex(self, key):
+        for token in self.row_tokens.pop(key, ()):
+            position = bisect.bisect_left(self.tokens, (token, key))
+            if position < len(self.tokens) and self.tokens[position] == (token, key):
+                del self.tokens[position]
+        self.row_text.pop(key, None)
+
+    # -- reading -----------------------------------------------------------
+
+    @property
+    def version_tag(self):
+        return f"{self.instance}.{self.version}"
+
+    def all_rows(self):
+        with self.lock:
+            return [self.rows[key] for key in self.order], self.version_tag
+
+    def _prefix_keys(self, term):
+        keys = set()
+        position = bisect.bisect_left(self.tokens, (term,))
+        while position < len(self.tokens) and self.tokens[position][0].startswith(term):
+            keys.add(self.tokens[position][1])
+            position += 1
+        return keys
+
+    def _rank(self, key, query, terms):
+        row = self.rows[key]
+        codes = [_text(row.get(field)) for field in self.help_list.code_fields]
+        if query in codes:
+            return RANK_CODE
+        if any(code.startswith(query) for code in codes if code):
+            return RANK_CODE_PREFIX
+        if any(_text(row.get(field)).startswith(query) for field in self.help_list.name_fields):
+            return RANK_NAME_PREFIX
+        if all(any(token.startswith(term) for token in self.row_tokens[key]) for term in terms):
+            return RANK_TOKEN_PREFIX
+        return RANK_SUBSTRING
+
+    def search(self, text, limit):
+        query = _text(text)
+        terms = TOKEN_PATTERN.findall(query)
+        if not terms:
+            return []
+        with self.lock:
+            candidates = None
+            for term in terms:
+                keys = self._prefix_keys(term)
+                candidates = keys if candidates is None else candidates & keys
+            if len(candidates) < limit:
+                # Fill up with rows that only contain the terms somewhere inside a word
+                candidates |= {key for key, row_text in self.row_text.items() if all(term in row_text for term in terms)}
+            ranked = sorted(candidates, key=lambda key: (self._rank(key, query, terms), self.positions[key]))
+            return [self.rows[key] for key in ranked[:limit]]
+
+    def changes_since(self, since):
+        with self.lock:
+            instance, _, number = since.partition('.')
+            if instance != self.instance or not number.isdigit() or int(number) > self.version:
+                return {"version": self.version_tag, "full": True, "rows": [self.rows[key] for key in self.order], "deleted": []}
+            since_version = int(number)
+            return {
+                "version": self.version_tag,
+                "full": False,
+                "rows": [self.rows[key] for key in self.order if self.changed_at.get(key, 0) > since_version],
+                "deleted": [key for key, version in self.deleted_at.items() if version > since_version]
+            }
+
+
+class HelpList:
+    """One Help lookup list: `load_rows(scope, keys)` reads the rows of a scope, or only `keys` of it."""
+
+    def __init__(self, name, load_rows, key, name_fields, code_fields=(), sort_key=None, reverse=False, max_age=HELP_INDEX_MAX_AGE):
+        self.name = name
+        self.load_rows = load_rows
+        self.key = key
+        self.name_fields = tuple(name_fields)
+        self.code_fields = tuple(code_fields)
+        self.sort_key = sort_key
+        self.reverse = reverse
+        self.max_age = max_age
+        self._indexes = {}
+        self._lock = threading.Lock()
+        _help_lists[name] = self
+
+    def index(self, scope):
+        with self._lock:
+            index = self._indexes.get(scope)
+            if index is None:
+                index = self._indexes[scope] = _HelpIndex(self, scope)
+        index.refresh()
+        return index
+
+    def mark_changed(self, company_code, keys=None):
+        with self._lock:
+            indexes = [index for scope, index in self._indexes.items() if scope[0] == company_code]
+        for index in indexes:
+            with index.lock:
+                if keys is None:
+                    index.reload_all = True
+                else:
+                    index.pending_keys.update(keys)
+
+
+def mark_help_changed(session, name, company_code, keys=None):
+    """Report changed master rows; the Help index re-reads them once the transaction commits."""
+    session.info.setdefault('help_changes', []).append((name, int(company_code), keys))
+
+
+# after_commit and after_rollback also fire for savepoints; the changes are kept until the
+# outermost transaction ends. Changes marked inside a rolled back savepoint are still
+# published, which only makes the index re-read rows that did not change.
+@event.listens_for(Session, 'after_commit')
+def _apply_help_changes(session):
+    if session.in_nested_transaction():
+        return
+    for name, company_code, keys in session.info.pop('help_changes', []):
+        help_list = _help_lists.get(name)
+        if help_list is not None:
+            help_list.mark_changed(company_code, keys)
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _discard_help_changes(session, transaction):
+    # Runs after _apply_help_changes; whatever is left was marked in a rolled back transaction
+    if transaction.parent is None:
+        session.info.pop('help_changes', None)
+
+
+def help_response(help_list, scope):
+    index = help_list.index(scope)
+
+    search = request.args.get('search')
+    if search is not None:
+        try:
+            limit = min(int(request.args.get('limit', HELP_SEARCH_LIMIT)), MAX_HELP_SEARCH_LIMIT)
+        except ValueError:
+            return jsonify({'error': 'Invalid limit parameter'}), 400
+        return jsonify(index.search(search, limit))
+
+    since = request.args.get('since')
+    if since:
+        return jsonify(index.changes_since(since))
+
+    rows, version = index.all_rows()
+    response = jsonify(rows)
+    response.headers['X-Help-Version'] = version
+    response.set_etag(f"{help_list.name}-{version}")
+    return response.make_conditional(request)
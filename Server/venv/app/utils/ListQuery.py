@@ -0,0 +1,327 @@
+import base64
+import binascii
+import json
+import re
+from flask import Response, current_app, jsonify, request, stream_with_context
+from sqlalchemy import and_, bindparam, func, inspect, literal_column, or_, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from app import db
+
+# Shared implementation of the getdata-* list endpoints: keyset (cursor) pagination,
+# whitelisted filters and sorting, an optional streamed response and a separate count.
+#
+# Query arguments understood by every list endpoint:
+#   limit=<n>                      page size; without it every matching row is returned
+#   cursor=<token>                 the next_cursor of the previous page
+#   sort=<column> or sort=-<column>    sort column, '-' for descending
+#   filter=<column>:<op>:<value>   repeatable; op is eq, ne, gt, gte, lt, lte, like or starts
+#   format=ndjson | stream         write rows as NDJSON lines or as one chunked JSON document
+#   count=1                        only return {"total": <number of matching rows>}
+#
+# Every request runs one SELECT (limit + 1 rows when paged), whose rows are converted and
+# written out LIST_CHUNK_SIZE at a time as they come off the cursor. The SELECT runs on a
+# connection of its own: pymssql has no MARS, so the lookups of a chunk (`preload` and
+# `lookups` below, one statement per chunk rather than per row) go through the session's
+# connection while the list cursor still has rows.
+
+LIST_CHUNK_SIZE = 500
+MAX_PAGE_SIZE = 5000
+
+FILTER_OPERATORS = {
+    'eq': lambda column, value: column == value,
+    'ne': lambda column, value: column != value,
+    'gt': lambda column, value: column > value,
+    'gte': lambda column, value: column >= value,
+    'lt': lambda column, value: column < value,
+    'lte': lambda column, value: column <= value,
+    'like': lambda column, value: column.like(f"%{value}%"),
+    'starts': lambda column, value: column.like(f"{value}%"),
+}
+
+IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Output columns of the raw SQL list queries, discovered once per query text
+_sql_columns_cache = {}
+
+
+class ListQueryError(ValueError):
+    pass
+
+
+def format_date_columns(data, date_columns=('doc_date',)):
+    for name in date_columns:
+        if name in data:
+            data[name] = data[name].strftime('%Y-%m-%d') if data[name] else None
+    return data
+
+
+def _sql_source(sql, params):
+    statement = select(literal_column('*')).select_from(text(f"({sql}) AS list_rows"))
+    names = _sql_columns_cache.get(sql)
+    if names is None:
+        names = list(db.session.execute(statement.where(text('1 = 0')), params).keys())
+        _sql_columns_cache[sql] = names
+    columns = {name: literal_column(f"list_rows.{name}") for name in names if IDENTIFIER.match(name)}
+    return statement, columns
+
+
+def _entity_source(statement):
+    entity = statement.column_descriptions[0]['entity']
+    return statement, {column.key: column for column in entity.__table__.columns}
+
+
+def _parse_limit(value):
+    if value is None or value == '':
+        return None
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ListQueryError(f"Invalid limit: {value!r}")
+    if limit < 1:
+        raise ListQueryError("limit must be positive")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def _parse_sort(value, columns, default_sort):
+    sort = value or default_sort
+    descending = sort.startswith('-')
+    name = sort.lstrip('-')
+    if name not in columns:
+        raise ListQueryError(f"Cannot sort by {name!r}")
+    return name, descending
+
+
+def _parse_filters(values, columns):
+    conditions = []
+    for value in values:
+        parts = value.split(':', 2)
+        if len(parts) != 3:
+            raise ListQueryError(f"Invalid filter {value!r}, expected column:op:value")
+        name, operator, operand = parts
+        if name not in columns:
+            raise ListQueryError(f"Cannot filter by {name!r}")
+        if operator not in FILTER_OPERATORS:
+            raise ListQueryError(f"Unknown filter operator {operator!r}")
+        conditions.append(FILTER_OPERATORS[operator](columns[name], operand))
+    return conditions
+
+
+def encode_cursor(sort_value, key_value):
+    payload = json.dumps([sort_value, key_value], default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(token):
+    try:
+        sort_value, key_value = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (binascii.Error, ValueError, TypeError):
+        raise ListQueryError("Invalid cursor")
+    return sort_value, key_value
+
+
+def _keyset_condition(sort_column, key_column, descending, cursor):
+    # Rows strictly after the cursor in (sort, key) order. NULL sort values come first
+    # ascending and last descending, as on SQL Server.
+    sort_value, key_value = cursor
+    if sort_column is key_column:
+        return key_column < key_value if descending else key_column > key_value
+    if descending:
+        if sort_value is None:
+            return and_(sort_column.is_(None), key_column < key_value)
+        return or_(sort_column < sort_value, and_(sort_column == sort_value, key_column < key_value), sort_column.is_(None))
+    if sort_value is None:
+        return or_(and_(sort_column.is_(None), key_column > key_value), sort_column.isnot(None))
+    return or_(sort_column > sort_value, and_(sort_column == sort_value, key_column > key_value))
+
+
+def _value(item, name, entities):
+    return getattr(item, name) if entities else item._mapping[name]
+
+
+def load_related(items, names):
+    """Load the named collection relationships of a chunk of instances, one statement each.
+
+    The collections are set as if lazy loaded, so `item.<name>` issues no further query.
+    """
+    mapper = inspect(type(items[0]))
+    for name in names:
+        relationship = mapper.relationships[name]
+        (local, remote), = relationship.local_remote_pairs
+        local_key = mapper.get_property_by_column(local).key
+        remote_key = relationship.mapper.get_property_by_column(remote).key
+        statement = select(relationship.mapper).where(remote.in_({getattr(item, local_key) for item in items}))
+        if relationship.order_by:
+            statement = statement.order_by(*relationship.order_by)
+        related = {}
+        for row in db.session.scalars(statement):
+            related.setdefault(getattr(row, remote_key), []).append(row)
+        for item in items:
+            set_committed_value(item, name, related.get(getattr(item, local_key), []))
+
+
+def lookup_rows(sql, keys):
+    """Run a lookup query for a chunk of records and return its rows as {key: [row dicts]}.
+
+    `sql` takes the keys as `IN :keys` and selects the key of each row as lookup_key,
+    which is left out of the row dicts.
+    """
+    grouped = {}
+    statement = text(sql).bindparams(bindparam('keys', expanding=True))
+    for row in db.session.execute(statement, {'keys': list(keys)}):
+        values = dict(row._mapping)
+        grouped.setdefault(values.pop('lookup_key'), []).append(values)
+    return grouped
+
+
+class _ListPages:
+    """Streams the filtered statement from the cursor on and remembers where a limited read stopped."""
+
+    def __init__(self, statement, params, columns, key, sort, limit, cursor, entities):
+        self.statement = statement
+        self.params = params
+        self.key = key
+        self.sort_name, self.descending = sort
+        self.sort_column = columns[self.sort_name]
+        self.key_column = columns[key] if key != self.sort_name else self.sort_column
+        self.limit = limit
+        self.cursor = cursor
+        self.entities = entities
+        self.next_cursor = None
+
+    def _order_by(self):
+        columns = [self.sort_column] if self.key_column is self.sort_column else [self.sort_column, self.key_column]
+        return [column.desc() if self.descending else column.asc() for column in columns]
+
+    def chunks(self):
+        page = self.statement
+        if self.cursor is not None:
+            page = page.where(_keyset_condition(self.sort_column, self.key_column, self.descending, self.cursor))
+        page = page.order_by(*self._order_by())
+        if self.limit is not None:
+            # The extra row tells whether more rows follow
+            page = page.limit(self.limit + 1)
+
+        with db.engine.connect() as connection, Session(bind=connection) as rows_session:
+            options = {'stream_results': True, 'yield_per': LIST_CHUNK_SIZE}
+            if self.entities:
+                result = rows_session.execute(page, self.params, execution_options=options).scalars()
+            else:
+                result = connection.execute(page, self.params, execution_options=options)
+
+            remaining = self.limit
+            last = None
+            for items in result.partitions(LIST_CHUNK_SIZE):
+                more = remaining is not None and len(items) > remaining
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+                if items:
+                    last = items[-1]
+                if more:
+                    self.next_cursor = encode_cursor(_value(last, self.sort_name, self.entities), _value(last, self.key, self.entities))
+                if items:
+                    if self.entities:
+                        # Lazy loads and lookups of the instances go through the session, not the list connection
+                        items = [db.session.merge(item, load=False) for item in items]
+                    yield items
+                if more:
+                    return
+
+
+def list_response(source, params, key, convert, envelope, default_sort=None, not_found=None, extras=None,
+                  preload=(), lookups=None):
+    """Answer a list request for `source` using the query arguments described above.
+
+    `source` is either raw SQL text (rows are passed to `convert` as result rows) or an
+    ORM select of one model (rows are passed as model instances). `key` names a unique
+    column used to break ties in the keyset order. `extras(items)` may return further
+    top-level lists (keyed like the legacy response) for each page of items; endpoints
+    using it cannot stream. `preload` names collection relationships of the model loaded
+    for each chunk at once (see load_related). `lookups(items)` runs the lookups of a whole
+    chunk, and `convert` is then called as convert(item, <what lookups returned>).
+    """
+    try:
+        entities = not isinstance(source, str)
+        statement, columns = _entity_source(source) if entities else _sql_source(source, params)
+
+        conditions = _parse_filters(request.args.getlist('filter'), columns)
+        if conditions:
+            statement = statement.where(*conditions)
+
+        if request.args.get('count') in ('1', 'true'):
+            total = db.session.execute(select(func.count()).select_from(statement.subquery()), params).scalar()
+            return jsonify({"total": total}), 200
+
+        limit = _parse_limit(request.args.get('limit'))
+        sort = _parse_sort(request.args.get('sort'), columns, default_sort or key)
+        cursor = decode_cursor(request.args['cursor']) if request.args.get('cursor') else None
+        output = request.args.get('format', 'json')
+        if output not in ('json', 'ndjson', 'stream'):
+            raise ListQueryError(f"Unknown format {output!r}")
+        if output != 'json' and extras is not None:
+            raise ListQueryError("This list cannot be streamed")
+    except ListQueryError as e:
+        return jsonify({"error": "Bad Request", "message": str(e)}), 400
+
+    pages = _ListPages(statement, params, columns, key, sort, limit, cursor, entities)
+    chunks = pages.chunks()
+    first_chunk = next(chunks, [])
+    if not first_chunk and cursor is None and not_found:
+        return jsonify({"error": not_found}), 404
+
+    def all_chunks():
+        if first_chunk:
+            yield first_chunk
+        yield from chunks
+
+    def converted(chunk):
+        if preload:
+            load_related(chunk, preload)
+        if lookups is None:
+            return [convert(item) for item in chunk]
+        found = lookups(chunk)
+        return [convert(item, found) for item in chunk]
+
+    if output == 'json':
+        response = {envelope: []}
+        for chunk in all_chunks():
+            response[envelope].extend(converted(chunk))
+            if extras is not None:
+                for name, values in extras(chunk).items():
+                    response.setdefault(name, []).extend(values)
+        if limit is not None:
+            response["next_cursor"] = pages.next_cursor
+        return jsonify(response), 200
+
+    dumps = current_app.json.dumps
+    # The first chunk is converted before the view returns; the later chunks are read and
+    # converted inside the streaming context, one chunk in memory at a time.
+    first_lines = [dumps(item) for item in converted(first_chunk)] if first_chunk else []
+
+    def json_lines():
+        if first_lines:
+            yield first_lines
+        for chunk in chunks:
+            yield [dumps(item) for item in converted(chunk)]
+
+    def ndjson_lines():
+        for lines in json_lines():
+            yield ''.join(line + '\n' for line in lines)
+        if limit is not None and pages.next_cursor:
+            yield dumps({"next_cursor": pages.next_cursor}) + '\n'
+
+    def json_document():
+        yield '{' + dumps(envelope) + ': ['
+        separator = ''
+        for lines in json_lines():
+            yield separator + ', '.join(lines)
+            separator = ', '
+        tail = ']'
+        if limit is not None:
+            tail += ', "next_cursor": ' + dumps(pages.next_cursor)
+        yield tail + '}'
+
+    if output == 'ndjson':
+        return Response(stream_with_context(ndjson_lines()), mimetype='application/x-ndjson'), 200
+    return Response(stream_with_context(json_document()), mimetype='application/json'), 200
@@ -0,0 +1,131 @@
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Process-wide cache for master-data lookups (company parameters, account codes, items).
+# Entries expire after ttl_seconds and the least recently used entry is evicted once
+# max_entries is reached. Keys are tuples whose first element is the company code, so
+# every entry of one company can be dropped when its masters change.
+
+_MISSING = object()
+_caches = []
+
+
+class LookupCache:
+    def __init__(self, name, max_entries=1024, ttl_seconds=600):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation; a value loaded under an older generation is not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        _caches.append(self)
+
+    def get(self, key, default=_MISSING):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        return default
+
+    def set(self, key, value, generation=None):
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, loader):
+        # A missing row is not remembered, so a record added outside the API is seen at once
+        value = self.get(key)
+        if value is _MISSING:
+            generation = self._generation
+            value = loader()
+            if value is not None:
+                self.set(key, value, generation)
+        return value
+
+    def get_many(self, keys, load_missing):
+        """Return {key: value} for `keys`, loading every missing key with one load_missing(keys) call.
+
+        Keys that load_missing does not return map to None and, as in get_or_load, are not remembered.
+        """
+        found = {}
+        missing = []
+        for key in keys:
+            value = self.get(key)
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+        if missing:
+            generation = self._generation
+            loaded = load_missing(missing)
+            for key in missing:
+                found[key] = loaded.get(key)
+                if found[key] is not None:
+                    self.set(key, found[key], generation)
+        return found
+
+    def invalidate(self, company_code=None):
+        with self._lock:
+            if company_code is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == company_code]:
+                    del self._entries[key]
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+
+def invalidate_after_transaction(session, cache, company_code=None):
+    """Drop the entries now and again when the session's outermost transaction ends.
+
+    The second pass removes values read by concurrent requests before the
+    commit, and on rollback the values this transaction loaded itself.
+    Savepoints ending inside the transaction do not trigger it.
+    """
+    cache.invalidate(company_code)
+    session.info.setdefault('lookup_invalidations', []).append((cache, company_code))
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _apply_pending_invalidations(session, transaction):
+    if transaction.parent is not None:
+        return
+    for cache, company_code in session.info.pop('lookup_invalidations', []):
+        cache.invalidate(company_code)
+
+
+def lookup_cache_stats():
+    return {cache.name: cache.stats() for cache in _caches}
@@ -0,0 +1,267 @@
+import logging
+import threading
+import time
+from collections import deque
+from flask import g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Per-request SQL instrumentation. Engine events time every statement the request runs
+# and count the rows it reads or writes; at the end of the request the totals go to
+#   - X-DB-* response headers and a db entry in Server-Timing (debug mode or SQL_METRICS_HEADERS)
+#   - per-endpoint statistics served by /sql-metrics
+#   - the slow request log (requests slower than SLOW_REQUEST_MS)
+# A statement run SQL_REPEAT_THRESHOLD times or more in one request with different
+# parameters (one query per row of a list, the N+1 pattern) is reported as repeated.
+
+logger = logging.getLogger(__name__)
+
+SLOWEST_KEPT = 5
+# Distinct parameter sets remembered per statement; enough to tell a loop from a retry
+PARAMETER_SETS_KEPT = 100
+LATENCY_SAMPLES_KEPT = 500
+SLOW_REQUESTS_KEPT = 50
+STATEMENT_TEXT_LENGTH = 300
+
+
+def _short(statement):
+    return " ".join(statement.split())[:STATEMENT_TEXT_LENGTH]
+
+
+class _CountingCursor:
+    # Counts the rows fetched from a result; everything else is answered by the DBAPI cursor
+
+    def __init__(self, cursor, metrics):
+        self._cursor = cursor
+        self._metrics = metrics
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._metrics.rows += 1
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._metrics.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._metrics.rows += len(rows)
+        return rows
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class RequestSqlMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_ms = 0.0
+        # Rows fetched plus rows reported written
+        self.rows = 0
+        self.slowest = []
+        # statement -> [executions, distinct parameter sets, ms]
+        self.statements = {}
+
+    def record(self, statement, parameters, elapsed_ms):
+        self.queries += 1
+        self.db_ms += elapsed_ms
+        entry = self.statements.get(statement)
+        if entry is None:
+            entry = self.statements[statement] = [0, set(), 0.0]
+        entry[0] += 1
+        entry[2] += elapsed_ms
+        if len(entry[1]) < PARAMETER_SETS_KEPT:
+            entry[1].add(repr(parameters))
+
+        self.slowest.append((elapsed_ms, statement))
+        self.slowest.sort(key=lambda item: item[0], reverse=True)
+        del self.slowest[SLOWEST_KEPT:]
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def repeated(self, threshold):
+        """Statements run `threshold` times or more with different parameters."""
+        found = [
+            {"statement": _short(statement), "count": count, "parameter_sets": len(parameter_sets), "db_ms": round(ms, 2)}
+            for statement, (count, parameter_sets, ms) in self.statements.items()
+            if count >= threshold and len(parameter_sets) > 1
+        ]
+        return sorted(found, key=lambda item: item["count"], reverse=True)
+
+    def summary(self, threshold):
+        return {
+            "queries": self.queries,
+            "db_ms": round(self.db_ms, 2),
+            "rows": self.rows,
+            "slowest": [{"statement": _short(statement), "ms": round(ms, 2)} for ms, statement in self.slowest],
+            "repeated": self.repeated(threshold)
+        }
+
+
+class EndpointStats:
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.max_queries = 0
+        self.db_ms = 0.0
+        self.rows = 0
+        self.slow_requests = 0
+        self.repeated_requests = 0
+        # The statement repeated most in the last request that repeated one
+        self.last_repeated = None
+        self.latencies = deque(maxlen=LATENCY_SAMPLES_KEPT)
+
+    def as_dict(self):
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))], 2) if latencies else None
+
+        return {
+            "requests": self.requests,
+            "avg_queries": round(self.queries / self.requests, 2) if self.requests else 0,
+            "max_queries": self.max_queries,
+            "avg_db_ms": round(self.db_ms / self.requests, 2) if self.requests else 0,
+            "avg_rows": round(self.rows / self.requests, 2) if self.requests else 0,
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+            "slow_requests": self.slow_requests,
+            "repeated_statement_requests": self.repeated_requests,
+            "last_repeated": self.last_repeated
+        }
+
+
+_lock = threading.Lock()
+_endpoints = {}
+_slow_requests = deque(maxlen=SLOW_REQUESTS_KEPT)
+
+
+def current_sql_metrics():
+    """The metrics of the request being served, None outside a request."""
+    if not has_app_context():
+        return None
+    return g.get('sql_metrics')
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and current_sql_metrics() is not None:
+        context.sql_metrics_started = time.perf_counter()
+
+
+def _stop_timer(context):
+    started = getattr(context, 'sql_metrics_started', None)
+    if started is None:
+        return None
+    context.sql_metrics_started = None
+    return (time.perf_counter() - started) * 1000
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    metrics = current_sql_metrics()
+    elapsed_ms = _stop_timer(context) if metrics is not None else None
+    if elapsed_ms is None:
+        return
+    metrics.record(statement, parameters, elapsed_ms)
+    if cursor.description is None:
+        metrics.rows += max(cursor.rowcount, 0)
+    elif not executemany:
+        # The rows are fetched after this event, through the cursor of the execution context
+        context.cursor = _CountingCursor(cursor, metrics)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute, it is counted here
+    metrics = current_sql_metrics()
+    elapsed_ms = _stop_timer(exception_context.execution_context) if metrics is not None else None
+    if elapsed_ms is not None:
+        metrics.record(exception_context.statement, exception_context.parameters, elapsed_ms)
+
+
+def _start_request():
+    g.sql_metrics = RequestSqlMetrics()
+
+
+def _add_headers(app, response):
+    metrics = current_sql_metrics()
+    if metrics is None or not (app.debug or app.config.get('SQL_METRICS_HEADERS')):
+        return response
+    # A streamed list runs the lookups of its later chunks after the headers are sent
+    response.headers['X-DB-Queries'] = str(metrics.queries)
+    response.headers['X-DB-Time'] = f"{metrics.db_ms:.2f}"
+    response.headers['X-DB-Rows'] = str(metrics.rows)
+    response.headers['X-DB-Repeated'] = str(len(metrics.repeated(app.config.get('SQL_REPEAT_THRESHOLD', 5))))
+    server_timing = response.headers.get('Server-Timing')
+    db_timing = f"db;dur={metrics.db_ms:.2f}"
+    response.headers['Server-Timing'] = f"{server_timing}, {db_timing}" if server_timing else db_timing
+    return response
+
+
+def _finish_request(app):
+    metrics = g.pop('sql_metrics', None)
+    if metrics is None:
+        return
+    elapsed_ms = metrics.elapsed_ms()
+    threshold = app.config.get('SQL_REPEAT_THRESHOLD', 5)
+    slow = elapsed_ms >= app.config.get('SLOW_REQUEST_MS', 1000)
+    repeated = metrics.repeated(threshold)
+    endpoint = request.url_rule.rule if request.url_rule is not None else "(no route)"
+
+    with _lock:
+        stats = _endpoints.get(endpoint)
+        if stats is None:
+            stats = _endpoints[endpoint] = EndpointStats()
+        stats.requests += 1
+        stats.queries += metrics.queries
+        stats.max_queries = max(stats.max_queries, metrics.queries)
+        stats.db_ms += metrics.db_ms
+        stats.rows += metrics.rows
+        stats.latencies.append(elapsed_ms)
+        if slow:
+            stats.slow_requests += 1
+        if repeated:
+            stats.repeated_requests += 1
+            stats.last_repeated = repeated[0]
+
+    if slow:
+        entry = dict(metrics.summary(threshold), method=request.method, path=request.full_path.rstrip('?'),
+                     endpoint=endpoint, ms=round(elapsed_ms, 2))
+        with _lock:
+            _slow_requests.append(entry)
+        message = "Slow request %s %s: %.2f ms, %s queries, %.2f ms in the database, %s rows"
+        arguments = [request.method, entry['path'], elapsed_ms, metrics.queries, metrics.db_ms, metrics.rows]
+        if metrics.slowest:
+            message += "; slowest %.2f ms: %s"
+            arguments += [entry['slowest'][0]['ms'], entry['slowest'][0]['statement']]
+        if repeated:
+            message += "; run %s times: %s"
+            arguments += [repeated[0]['count'], repeated[0]['statement']]
+        logger.warning(message, *arguments)
+
+
+def sql_metrics_stats():
+    with _lock:
+        return {
+            "endpoints": {endpoint: stats.as_dict() for endpoint, stats in sorted(_endpoints.items())},
+            "slow_requests": list(_slow_requests)
+        }
+
+
+def reset_sql_metrics():
+    with _lock:
+        _endpoints.clear()
+        _slow_requests.clear()
+
+
+def init_sql_metrics(app):
+    event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(Engine, 'handle_error', _handle_error)
+    app.before_request(_start_request)
+    app.after_request(lambda response: _add_headers(app, response))
+    # Runs after a streamed response has been written out
+    app.teardown_request(lambda exc: _finish_request(app))
@@ -0,0 +1,29 @@
+import time
+
+# Lap timer for multi-stage saves: mark(name) records the time spent since the previous mark.
+
+
+class StageTimer:
+    def __init__(self):
+        self.stages = []
+        self.started = time.perf_counter()
+        self._last = self.started
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.stages.append((name, (now - self._last) * 1000))
+        self._last = now
+
+    def total_ms(self):
+        return (self._last - self.started) * 1000
+
+    def as_dict(self):
+        timings = {name: round(elapsed, 2) for name, elapsed in self.stages}
+        timings['total'] = round(self.total_ms(), 2)
+        return timings
+
+    def server_timing(self):
+        # Value for the Server-Timing response header, shown per stage in the browser dev tools
+        parts = [f"{name};dur={elapsed:.2f}" for name, elapsed in self.stages]
+        parts.append(f"total;dur={self.total_ms():.2f}")
+        return ", ".join(parts)
@@ -0,0 +1,149 @@
+from decimal import Decimal
+from sqlalchemy import event, func, select, text
+from sqlalchemy.orm import Session
+from app import db
+from app.models.BusinessReleted.DeliveryOrder.DeliveryOrderModels import DeliveryOrderHead
+from app.models.BusinessReleted.TenderPurchase.TenderPurchaseModels import TenderBalance, TenderDetails, TenderHead
+
+# Buyer_Quantal, DESPATCH and BALANCE of every tender detail, kept in nt_1_tenderbalance instead
+# of being recomputed from all Delivery Orders by qrytenderdobalanceview on each lookup.
+# Documents that change tender details, or the quantity a DO takes from them, report the
+# tenders / details with mark_tender_balance_changed(); those rows are recomputed just before
+# the session commits, so the index is written in the document's own transaction.
+#
+# DESPATCH is the quantal of the DOs pointing at the detail through tenderdetailid, plus
+# quantal1 of those pointing at it through tenderdetailid1. BALANCE = Buyer_Quantal - DESPATCH.
+#
+# After creating the table run
+#     flask --app run tender-balance rebuild <Company_Code>
+# and compare it with the view at any time with
+#     flask --app run tender-balance reconcile <Company_Code>
+
+balance_table = TenderBalance.__table__
+QUANTITY_PLACES = Decimal('0.01')
+IN_CHUNK_SIZE = 1000
+DISPATCH_COLUMNS = (
+    (DeliveryOrderHead.tenderdetailid, DeliveryOrderHead.quantal),
+    (DeliveryOrderHead.tenderdetailid1, DeliveryOrderHead.quantal1),
+)
+QUANTITY_COLUMNS = ('Buyer_Quantal', 'DESPATCH', 'BALANCE')
+
+
+def _quantity(value):
+    return Decimal(str(value or 0)).quantize(QUANTITY_PLACES)
+
+
+def _chunks(values):
+    values = sorted(values)
+    for start in range(0, len(values), IN_CHUNK_SIZE):
+        yield values[start:start + IN_CHUNK_SIZE]
+
+
+def mark_tender_balance_changed(session, tenderids=(), tenderdetailids=()):
+    """Recompute the balances of these tenders and tender details when the session commits."""
+    changed_tenderids, changed_detailids = session.info.setdefault('tender_balance_changes', (set(), set()))
+    changed_tenderids.update(int(tenderid) for tenderid in tenderids if tenderid)
+    changed_detailids.update(int(detailid) for detailid in tenderdetailids if detailid)
+
+
+# before_commit and after_rollback also fire for savepoints; the marks are kept until the
+# outermost transaction commits, so the refresh sees every write of the request
+@event.listens_for(Session, 'before_commit')
+def _refresh_marked_tender_balances(session):
+    if session.in_nested_transaction():
+        return
+    changes = session.info.pop('tender_balance_changes', None)
+    if changes and (changes[0] or changes[1]):
+        session.flush()
+        refresh_tender_balances(changes[0], changes[1], session)
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _discard_tender_balance_changes(session, transaction):
+    if transaction.parent is None:
+        session.info.pop('tender_balance_changes', None)
+
+
+def compute_tender_balances(tenderdetailids, session=None):
+    """{tenderdetailid: index row} computed from nt_1_tender, nt_1_tenderdetails and nt_1_deliveryorder."""
+    session = session or db.session
+    rows = {}
+    for chunk in _chunks(tenderdetailids):
+        statement = select(
+            TenderDetails.tenderdetailid, TenderDetails.tenderid, TenderHead.Company_Code, TenderHead.Mill_Code,
+            TenderHead.Tender_No, TenderDetails.ID, TenderDetails.Buyer_Quantal
+        ).join(TenderHead, TenderHead.tenderid == TenderDetails.tenderid).where(TenderDetails.tenderdetailid.in_(chunk))
+        for row in session.execute(statement).all():
+            rows[row.tenderdetailid] = dict(row._mapping, Buyer_Quantal=_quantity(row.Buyer_Quantal), DESPATCH=_quantity(0))
+
+        for detail_column, quantal_column in DISPATCH_COLUMNS:
+            statement = select(detail_column, func.sum(quantal_column)).where(detail_column.in_(chunk)).group_by(detail_column)
+            for detailid, quantal in session.execute(statement).all():
+                if detailid in rows:
+                    rows[detailid]['DESPATCH'] += _quantity(quantal)
+
+    for row in rows.values():
+        row['BALANCE'] = row['Buyer_Quantal'] - row['DESPATCH']
+    return rows
+
+
+def refresh_tender_balances(tenderids=(), tenderdetailids=(), session=None):
+    """Rewrite the index rows of these tenders and tender details. Does not commit."""
+    session = session or db.session
+    detailids = set(tenderdetailids)
+    for chunk in _chunks(set(tenderids)):
+        # Rows of details deleted since the last refresh are only found through the index
+        detailids.update(session.execute(select(TenderDetails.tenderdetailid).where(TenderDetails.tenderid.in_(chunk))).scalars().all())
+        detailids.update(session.execute(select(balance_table.c.tenderdetailid).where(balance_table.c.tenderid.in_(chunk))).scalars().all())
+
+    rows = compute_tender_balances(detailids, session)
+    for chunk in _chunks(detailids):
+        session.execute(balance_table.delete().where(balance_table.c.tenderdetailid.in_(chunk)))
+    if rows:
+        session.execute(balance_table.insert(), [rows[detailid] for detailid in sorted(rows)])
+    return len(rows)
+
+
+def rebuild_tender_balances(company_code):
+    """Rewrite the index rows of every tender of the company. Does not commit."""
+    company_code = int(company_code)
+    tenderids = set(db.session.execute(select(TenderHead.tenderid).where(TenderHead.Company_Code == company_code)).scalars().all())
+    tenderids.update(db.session.execute(
+        select(balance_table.c.tenderid).where(balance_table.c.Company_Code == company_code).distinct()
+    ).scalars().all())
+    return refresh_tender_balances(tenderids)
+
+
+def reconcile_tender_balances(company_code):
+    """Compare the index with qrytenderdobalanceview and list the tender details that differ."""
+    company_code = int(company_code)
+    view_rows = {
+        row['tenderdetailid']: row for row in db.session.execute(text('''
+            select tenderdetailid, Tender_No, ID, Buyer_Quantal, DESPATCH, BALANCE
+            from qrytenderdobalanceview
+            where Company_Code = :company_code
+        '''), {'company_code': company_code}).mappings().all()
+    }
+    index_rows = {
+        row['tenderdetailid']: row for row in db.session.execute(
+            select(balance_table).where(balance_table.c.Company_Code == company_code)
+        ).mappings().all()
+    }
+
+    def quantities(row):
+        return None if row is None else {name: _quantity(row[name]) for name in QUANTITY_COLUMNS}
+
+    drift = []
+    for detailid in sorted(set(view_rows) | set(index_rows)):
+        view_row = view_rows.get(detailid)
+        index_row = index_rows.get(detailid)
+        if quantities(view_row) != quantities(index_row):
+            row = view_row or index_row
+            drift.append({
+                'tenderdetailid': detailid,
+                'Tender_No': row['Tender_No'],
+                'ID': row['ID'],
+                'view': quantities(view_row),
+                'index': quantities(index_row)
+            })
+    return {'checked': len(set(view_rows) | set(index_rows)), 'drift': drift}
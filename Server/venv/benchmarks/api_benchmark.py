@@ -0,0 +1,478 @@
+"""Latency and SQL statements per request of the main voucher endpoints, through the Flask test client.
+
+The SQLite harness is seeded with accounts, items, tenders and vouchers, then every case is
+requested --requests times: the account master, sale bill, Delivery Order and UTR lists,
+their navigation and lookup by number, and the insert and update of the sale bill, purchase
+bill, UTR and Delivery Order vouchers (and the DO delete). The SQL Server join nesting and the
+CONVERT calls of the raw queries are translated by benchmarks/bench_app.py, and the views they
+read are seeded. The X-DB-* headers of app/utils/SqlMetrics.py
+give the statements, database time and rows of each request; statements run
+SQL_REPEAT_THRESHOLD times or more with different parameters (one query per row, N+1) are
+listed after the table. --save keeps the results as a baseline, --compare reports the cases
+that got slower or run more statements than the baseline. Run from the Server/venv directory:
+
+    python -m benchmarks.api_benchmark --vouchers 100 --accounts 100 --requests 20
+    python -m benchmarks.api_benchmark --save baseline.json
+    python -m benchmarks.api_benchmark --compare baseline.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import time
+from decimal import Decimal
+from benchmarks.bench_app import create_bench_app
+
+app, db = create_bench_app()
+
+from sqlalchemy import text
+from app.models.Masters.AccountInformation.AccountMaster.AccountMasterModel import AccountMaster
+from app.models.Masters.CompanyParameters.CompanyParameterModels import CompanyParameters
+from app.models.Outword.SaleBill.SaleBillModels import SaleBillHead, SaleBillDetail
+from app.models.Inword.PurchaseBill.PurchaseBillModels import SugarPurchase, SugarPurchaseDetail
+from app.models.Transactions.ReceiptPayment.ReceiptPaymentModels import ReceiptPaymentHead, ReceiptPaymentDetail
+from app.models.Transactions.UTR.UTREntryModels import UTRHead, UTRDetail
+from app.models.Masters.OtherMasters.SystemMasterModels import SystemMaster
+from app.models.BusinessReleted.TenderPurchase.TenderPurchaseModels import TenderHead, TenderDetails
+from app.models.BusinessReleted.DeliveryOrder.DeliveryOrderModels import DeliveryOrderHead, DeliveryOrderDetail
+
+API = '/api/sugarian'
+COMPANY_CODE = 1
+YEAR_CODE = 1
+DETAILS_PER_VOUCHER = 5
+ITEM_ID = 1
+
+# Columns of the production tables that the models do not map but the raw queries join on
+PRODUCTION_COLUMNS = {
+    'nt_1_bsgroupmaster': ['bsid INTEGER'],
+    'nt_1_citymaster': ['cityid INTEGER'],
+    'nt_1_tender': ['AutoPurchaseBill TEXT']
+}
+# Production views read by the benchmarked queries, with the columns those queries use
+PRODUCTION_VIEWS = {
+    'qrymstaccountmaster': '''
+        select account.*, city.city_name_e as cityname
+        from nt_1_accountmaster as account left outer join nt_1_citymaster as city on account.cityid = city.cityid
+    '''
+}
+
+
+def fill(model, values, skip=()):
+    # Every column of the model, with a neutral value where `values` has none
+    row = {}
+    for column in model.__table__.columns:
+        if column.key in skip or (column.primary_key and column.key not in values):
+            continue
+        python_type = column.type.python_type
+        if column.key in values:
+            row[column.key] = values[column.key]
+        elif python_type in (int, float, Decimal, bool):
+            row[column.key] = 0
+        elif python_type.__name__ in ('date', 'datetime'):
+            row[column.key] = '2024-08-01'
+        else:
+            row[column.key] = ''
+    return row
+
+
+def seed(vouchers, accounts):
+    for table, columns in PRODUCTION_COLUMNS.items():
+        for column in columns:
+            db.session.execute(text(f"ALTER TABLE dbo.{table} ADD COLUMN {column}"))
+    for view, query in PRODUCTION_VIEWS.items():
+        db.session.execute(text(f"CREATE VIEW dbo.{view} AS {query}"))
+
+    for ac_code in range(1, accounts + 1):
+        db.session.add(AccountMaster(**fill(AccountMaster, {
+            'Ac_Code': ac_code, 'company_code': COMPANY_CODE, 'Ac_Name_E': f'Account {ac_code}', 'Short_Name': f'AC{ac_code}'
+        })))
+    # Every parameter account is account 1, so the GLedger postings resolve
+    parameters = {column.key: 1 for column in CompanyParameters.__table__.columns if column.type.python_type is int and column.key != 'id'}
+    parameters.update({'Company_Code': COMPANY_CODE, 'Year_Code': YEAR_CODE, 'AutoVoucher': 'YES'})
+    db.session.add(CompanyParameters(**fill(CompanyParameters, parameters)))
+    # The item of every detail row; its sale and purchase accounts are account 1 as well
+    db.session.add(SystemMaster(**fill(SystemMaster, {
+        'systemid': ITEM_ID, 'System_Type': 'I', 'System_Code': ITEM_ID, 'System_Name_E': 'Sugar',
+        'Sale_AC': 1, 'Purchase_AC': 1, 'Company_Code': COMPANY_CODE
+    })))
+    db.session.flush()
+
+    accoids = [accoid for (accoid,) in db.session.query(AccountMaster.accoid).order_by(AccountMaster.Ac_Code)]
+    for doc_no in range(1, vouchers + 1):
+        ac_code = doc_no % accounts + 1
+        accoid = accoids[ac_code - 1]
+
+        sale = SaleBillHead(**sale_head(doc_no, ac_code, accoid))
+        purchase = SugarPurchase(**purchase_head(doc_no, ac_code, accoid))
+        receipt = ReceiptPaymentHead(**receipt_head(doc_no))
+        utr = UTRHead(**utr_head(doc_no, ac_code, accoid))
+        # Every DO takes from the tender of the same number
+        tender = TenderHead(**tender_head(doc_no, ac_code, accoid))
+        db.session.add_all([sale, purchase, receipt, utr, tender])
+        db.session.flush()
+        tender_detail = TenderDetails(**tender_detail_row(doc_no, tender.tenderid, accoid))
+        db.session.add(tender_detail)
+        db.session.flush()
+        delivery_order = DeliveryOrderHead(**dict(do_head(doc_no, ac_code, accoid), tenderid=tender.tenderid,
+                                                  tenderdetailid=tender_detail.tenderdetailid))
+        db.session.add(delivery_order)
+        db.session.flush()
+        for line in range(DETAILS_PER_VOUCHER):
+            db.session.add(SaleBillDetail(**sale_detail(line), doc_no=doc_no, saleid=sale.saleid))
+            db.session.add(SugarPurchaseDetail(**purchase_detail(line), doc_no=doc_no, purchaseid=purchase.purchaseid))
+            db.session.add(ReceiptPaymentDetail(**receipt_detail(line, ac_code, accoid), doc_no=doc_no, tranid=receipt.tranid))
+            db.session.add(UTRDetail(**utr_detail(line), doc_no=doc_no, utrid=utr.utrid))
+            db.session.add(DeliveryOrderDetail(**do_detail(line, accoid), doc_no=doc_no, doid=delivery_order.doid))
+    db.session.commit()
+
+
+def sale_head(doc_no, ac_code, accoid):
+    return fill(SaleBillHead, {
+        'doc_no': doc_no, 'Company_Code': COMPANY_CODE, 'Year_Code': YEAR_CODE, 'Tran_Type': 'SB', 'doc_date': '2024-08-01',
+        'Ac_Code': ac_code, 'ac': accoid, 'Unit_Code': ac_code, 'uc': accoid, 'mill_code': ac_code, 'mc': accoid,
+        'Transport_Code': ac_code, 'Bill_Amount': 35000, 'CGSTAmount': 875, 'SGSTAmount': 875
+    }, skip=('saleid',))
+
+
+def sale_detail(line):
+    return fill(SaleBillDetail, {
+        'detail_id': line + 1, 'Tran_Type': 'SB', 'item_code': 1, 'ic': 1, 'narration': f'line {line}', 'Quantal': 10,
+        'packing': 50, 'bags': 20, 'rate': 3500, 'item_Amount': 35000, 'Company_Code': COMPANY_CODE, 'Year_Code': YEAR_CODE
+    }, skip=('saledetailid', 'saleid', 'doc_no'))
+
+
+def tender_head(doc_no, ac_code, accoid):
+    return fill(TenderHead, {
+        'Tender_No': doc_no, 'Company_Code': COMPANY_CODE, 'Year_Code': YEAR_CODE, 'Tender_Date': '2024-08-01',
+        'Lifting_Date': '2024-08-01', 'Mill_Code': ac_code, 'mc': accoid, 'Quantal': 100000, 'Mill_Rate': 3400,
+        'Grade': 'S', 'itemcode': ITEM_ID, 'ic': ITEM_ID, 'AutoPurchaseBill': 'N'
+    }, skip=('tenderid',))
+
+
+def tender_detail_row(doc_no, tenderid, accoid):
+    return fill(TenderDetails, {
+        'Tender_No': doc_no, 'Company_Code': COMPANY_CODE, 'year_code': YEAR_CODE, 'ID': 1, 'tenderid': tenderid,
+        'Buyer_Quantal': 100000, 'Sale_Rate': 3500, 'buyerid': accoid, 'buyerpartyid': accoid, 'Delivery_Type': 'C'
+    }, skip=('tenderdetailid',))
+
+
+def do_head(doc_no, ac_code, accoid):
+    return fill(DeliveryOrderHead, {
+        'doc_no': doc_no, 'company_code': COMPANY_CODE, 'Year_Code': YEAR_CODE, 'tran_type': 'DO', 'desp_type': 'DO',
+        'doc_date': '2024-08-01', 'purc_no': doc_no, 'purc_order': 1, 'quantal': 10, 'mill_rate': 3400,
+        'sale_rate': 3500, 'mill_code': ac_code, 'mc': accoid, 'GETPASSCODE': ac_code, 'gp': accoid,
+        'SaleBillTo': ac_code, 'sb': accoid, 'voucher_by': ac_code, 'vb': accoid, 'transport': ac_code,
+        'tc': accoid, 'st': accoid, 'itemcode': ITEM_ID, 'ic': ITEM_ID, 'TDSCut': 'N'
+    }, skip=('doid',))
+
+
+def do_detail(line, accoid):
+    return fill(DeliveryOrderDetail, {
+        'detail_Id': line + 1, 'company_code': COMPANY_CODE, 'Year_Code': YEAR_CODE, 'ddType': 'T',
+        'Bank_Code': 1, 'bc': accoid, 'Narration': f'line {line}', 'Amount': 1000
+    }, skip=('dodetailid', 'doid', 'doc_no'))
+
+
+def purchase_head(doc_no, ac_code, accoid):
+    return fill(SugarPurchase, {
+        'doc_no': doc_no, 'Company_Code': COMPANY_CODE, 'Year_Code': YEAR_CODE, 'Tran_Type': 'PS', 'doc_date': '2024-08-01',
+        'Ac_Code': ac_code, 'ac': accoid, 'Unit_Code': ac_code, 'uc': accoid, 'mill_code': ac_code, 'mc': accoid,
+        'Bill_Amount': 34000
+    }, skip=('purchaseid',))
+
+
+def purchase_detail(line):
+    return fill(SugarPurchaseDetail, {
+        'detail_id': line + 1, 'Tran_Type': 'PS', 'item_code': 1, 'ic': 1, 'narration': f'line {line}', 'Quantal': 10,
+        'packing': 50, 'bags': 20, 'rate': 3400, 'item_Amount': 34000, 'Company_Code': COMPANY_CODE, 'Year_Code': YEAR_CODE
+    }, skip=('purchasedetailid', 'purchaseid', 'doc_no'))
+
+
+def receipt_head(doc_no):
+    return fill(ReceiptPaymentHead, {
+        'doc_no': doc_no, 'company_code': COMPANY_CODE, 'year_code': YEAR_CODE, 'tran_type': 'BR', 'doc_date': '2024-08-01',
+        'cashbank': 1, 'cb': 1, 'total': 5000
+    }, skip=('tranid',))
+
+
+def receipt_detail(line, ac_code, accoid):
+    return fill(ReceiptPaymentDetail, {
+        'detail_id': line + 1, 'Tran_Type': 'BR', 'credit_ac': ac_code, 'ca': accoid, 'amount': 1000,
+        'narration': f'line {line}', 'Company_Code': COMPANY_CODE, 'Year_Code': YEAR_CODE
+    }, skip=('trandetailid', 'tranid', 'doc_no'))
+
+
+def utr_head(doc_no, ac_code, accoid):
+    return fill(UTRHead, {
+        'doc_no': doc_no, 'Company_Code': COMPANY_CODE, 'Year_Code': YEAR_CODE, 'doc_date': '2024-08-01',
+        'bank_ac': ac_code, 'ba': accoid, 'mill_code': ac_code, 'mc': accoid, 'amount': 5000
+    }, skip=('utrid',))
+
+
+def utr_detail(line):
+    return fill(UTRDetail, {
+        'Detail_Id': line + 1, 'amount': 1000, 'Company_Code': COMPANY_CODE, 'Year_Code': YEAR_CODE
+    }, skip=('utrdetailid', 'utrid', 'doc_no'))
+
+
+def edit_rows(key, detail_ids, make_row):
+    # One row updated, one deleted and one added, as a user editing the grid; the GLedger
+    # posting of the bills reads the item and amount of every row
+    return [
+        {'rowaction': 'update', key: detail_ids[0], 'narration': 'edited', 'ic': 1, 'item_Amount': 30000},
+        {'rowaction': 'delete', key: detail_ids[1], 'ic': 1, 'item_Amount': 0},
+        dict(make_row(DETAILS_PER_VOUCHER), rowaction='add')
+    ]
+
+
+class Cases:
+    """The requests of the benchmark; every case returns (method, path, json body)."""
+
+    def __init__(self, vouchers):
+        self.vouchers = vouchers
+        self.scope = f"Company_Code={COMPANY_CODE}&Year_Code={YEAR_CODE}"
+        # The Delivery Order endpoints spell the company parameter in lower case
+        self.do_scope = f"company_code={COMPANY_CODE}&Year_Code={YEAR_CODE}"
+        self.step = 0
+
+    def doc_no(self):
+        # Walks over the seeded vouchers, so that the navigation does not read one record only
+        self.step += 1
+        return self.step % self.vouchers + 1
+
+    def inner_doc_no(self):
+        # A seeded voucher with seeded vouchers on both sides, for next and previous
+        self.step += 1
+        return self.step % max(self.vouchers - 2, 1) + 2
+
+    def ids(self, model, key, value):
+        with app.app_context():
+            return [row_id for (row_id,) in db.session.query(getattr(model, key)).filter_by(**value).order_by(getattr(model, key))]
+
+    def all(self):
+        return {
+            'list account master': lambda: ('GET', f"/getdata-accountmaster?Company_Code={COMPANY_CODE}", None),
+            'list utr': lambda: ('GET', f"/getdata-utr?{self.scope}", None),
+            'list sale bill': lambda: ('GET', f"/getdata-SaleBill?{self.scope}", None),
+            'list do': lambda: ('GET', f"/getdata-DO?{self.scope}", None),
+            'sale bill by number': lambda: ('GET', f"/SaleBillByid?{self.scope}&doc_no={self.doc_no()}", None),
+            'sale bill first': lambda: ('GET', f"/get-firstSaleBill-navigation?{self.scope}", None),
+            'sale bill last': lambda: ('GET', f"/get-lastSaleBill-navigation?{self.scope}", None),
+            'sale bill next': lambda: ('GET', f"/get-nextSaleBill-navigation?{self.scope}&currentDocNo={self.inner_doc_no()}", None),
+            'sale bill previous': lambda: ('GET', f"/get-previousSaleBill-navigation?{self.scope}&currentDocNo={self.inner_doc_no()}", None),
+            'do by number': lambda: ('GET', f"/DOByid?{self.do_scope}&doc_no={self.doc_no()}", None),
+            'do first': lambda: ('GET', f"/get-firstDO-navigation?{self.do_scope}", None),
+            'do last': lambda: ('GET', f"/get-lastDO-navigation?{self.do_scope}", None),
+            'do next': lambda: ('GET', f"/get-nextDO-navigation?{self.do_scope}&currentDocNo={self.inner_doc_no()}", None),
+            'do previous': lambda: ('GET', f"/get-previousDO-navigation?{self.do_scope}&currentDocNo={self.inner_doc_no()}", None),
+            'utr first': lambda: ('GET', f"/get-firstutr-navigation?{self.scope}", None),
+            'utr last': lambda: ('GET', f"/get-lastutrdata?{self.scope}", None),
+            'utr next': lambda: ('GET', f"/get-nextutr-navigation?{self.scope}&currentDocNo={self.inner_doc_no()}", None),
+            'utr previous': lambda: ('GET', f"/get-previousutr-navigation?{self.scope}&currentDocNo={self.inner_doc_no()}", None),
+            'insert utr': self.insert_utr,
+            'update utr': self.update_utr,
+            'insert sale bill': self.insert_sale_bill,
+            'update sale bill': self.update_sale_bill,
+            'insert purchase bill': self.insert_purchase_bill,
+            'update purchase bill': self.update_purchase_bill,
+            'insert do': self.insert_do,
+            'update do': self.update_do,
+            'delete do': self.delete_do
+        }
+
+    def insert_utr(self):
+        head = utr_head(0, 1, 1)
+        head.pop('doc_no')
+        detail = [dict(utr_detail(line), rowaction='add') for line in range(DETAILS_PER_VOUCHER)]
+        return 'POST', '/insert-utr', {'head_data': head, 'detail_data': detail}
+
+    def update_utr(self):
+        doc_no = self.doc_no()
+        utrid = self.ids(UTRHead, 'utrid', {'doc_no': doc_no, 'Company_Code': COMPANY_CODE})[0]
+        detail_ids = self.ids(UTRDetail, 'utrdetailid', {'utrid': utrid})
+        head = utr_head(doc_no, 1, 1)
+        detail = [
+            {'rowaction': 'update', 'utrdetailid': detail_ids[0], 'amount': 1500},
+            {'rowaction': 'delete', 'utrdetailid': detail_ids[1]},
+            dict(utr_detail(DETAILS_PER_VOUCHER), rowaction='add')
+        ]
+        return 'PUT', f"/update-utr?utrid={utrid}", {'head_data': head, 'detail_data': detail}
+
+    def insert_sale_bill(self):
+        head = sale_head(0, 1, 1)
+        head.pop('doc_no')
+        detail = [dict(sale_detail(line), rowaction='add') for line in range(DETAILS_PER_VOUCHER)]
+        return 'POST', '/insert-SaleBill', {'headData': head, 'detailData': detail}
+
+    def update_sale_bill(self):
+        doc_no = self.doc_no()
+        saleid = self.ids(SaleBillHead, 'saleid', {'doc_no': doc_no, 'Company_Code': COMPANY_CODE})[0]
+        detail_ids = self.ids(SaleBillDetail, 'saledetailid', {'saleid': saleid})
+        head = sale_head(doc_no, 1, 1)
+        return 'PUT', f"/update-SaleBill?saleid={saleid}", {'headData': head, 'detailData': edit_rows('saledetailid', detail_ids, sale_detail)}
+
+    def insert_purchase_bill(self):
+        head = purchase_head(0, 1, 1)
+        head.pop('doc_no')
+        detail = [dict(purchase_detail(line), rowaction='add') for line in range(DETAILS_PER_VOUCHER)]
+        return 'POST', '/insert_SugarPurchase', {'headData': head, 'detailData': detail}
+
+    def update_purchase_bill(self):
+        doc_no = self.doc_no()
+        purchaseid = self.ids(SugarPurchase, 'purchaseid', {'doc_no': doc_no, 'Company_Code': COMPANY_CODE})[0]
+        detail_ids = self.ids(SugarPurchaseDetail, 'purchasedetailid', {'purchaseid': purchaseid})
+        head = purchase_head(doc_no, 1, 1)
+        return 'PUT', f"/update-SugarPurchase?purchaseid={purchaseid}", {'headData': head, 'detailData': edit_rows('purchasedetailid', detail_ids, purchase_detail)}
+
+
+    def do_payload(self, doc_no):
+        # A DO against the tender of the same number; the seeded DOs are numbered as their tenders
+        return dict(do_head(doc_no, 1, 1), Delivery_Type='C')
+
+    def insert_do(self):
+        # Only the insert reads the automatic purchase bill flag
+        head = dict(self.do_payload(self.doc_no()), AutopurchaseBill='N')
+        head.pop('doc_no')
+        detail = [dict(do_detail(line, 1), rowaction='add') for line in range(DETAILS_PER_VOUCHER)]
+        return 'POST', '/insert-DeliveryOrder', {'headData': head, 'detailData': detail}
+
+    def saved_do(self):
+        # A DO saved through the API (not measured), with the commission bill and ledger rows the
+        # update and delete rewrite; the seeded DOs have only their head and detail rows
+        method, path, body = self.insert_do()
+        with contextlib.redirect_stdout(io.StringIO()):
+            saved = app.test_client().open(API + path, method=method, json=body)
+        if saved.status_code >= 400:
+            raise RuntimeError(f"saving a DO failed: {saved.status_code} {saved.get_data(as_text=True)[:200]}")
+        with app.app_context():
+            do = db.session.query(DeliveryOrderHead).order_by(DeliveryOrderHead.doid.desc()).first()
+            return {'doid': do.doid, 'doc_no': do.doc_no, 'purc_no': do.purc_no, 'voucher_no': do.voucher_no}
+
+    def update_do(self):
+        saved = self.saved_do()
+        doid = saved.pop('doid')
+        # As the client does, the tender and the commission bill (an LV voucher, a type the insert
+        # does not keep on the DO) are sent back with the DO
+        head = dict(self.do_payload(saved['purc_no']), voucher_type='LV', **saved)
+        detail_ids = self.ids(DeliveryOrderDetail, 'dodetailid', {'doid': doid})
+        detail = [
+            {'rowaction': 'update', 'dodetailid': detail_ids[0], 'Amount': 1500},
+            {'rowaction': 'delete', 'dodetailid': detail_ids[1]},
+            dict(do_detail(DETAILS_PER_VOUCHER, 1), rowaction='add')
+        ]
+        return 'PUT', f"/update-DeliveryOrder?doid={doid}", {'headData': head, 'detailData': detail}
+
+    def delete_do(self):
+        # Each request deletes a DO of its own, so the seeded ones stay
+        saved = self.saved_do()
+        return 'DELETE', f"/delete_data_by_doid?doid={saved['doid']}&{self.do_scope}&doc_no={saved['doc_no']}", None
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run_case(client, case, requests):
+    latencies, queries, db_ms, rows, errors = [], [], [], [], []
+    # The first request fills the lookup caches; it is not measured
+    for request_no in range(requests + 1):
+        method, path, body = case()
+        started = time.perf_counter()
+        # The controllers print debugging output
+        with contextlib.redirect_stdout(io.StringIO()):
+            response = client.open(API + path, method=method, json=body)
+            response.get_data()
+        if request_no == 0:
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            errors.append(f"{response.status_code} {response.get_data(as_text=True)[:200]}")
+        queries.append(int(response.headers.get('X-DB-Queries', 0)))
+        db_ms.append(float(response.headers.get('X-DB-Time', 0)))
+        rows.append(int(response.headers.get('X-DB-Rows', 0)))
+    return {
+        'p50_ms': round(statistics.median(latencies), 2),
+        'p95_ms': round(percentile(latencies, 0.95), 2),
+        'queries': round(statistics.mean(queries), 2),
+        'db_ms': round(statistics.mean(db_ms), 2),
+        'rows': round(statistics.mean(rows), 2),
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None
+    }
+
+
+def compare(results, baseline_path, tolerance):
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        # Averages move by a fraction of a statement with the vouchers walked over
+        if result['queries'] > before['queries'] + 0.5:
+            regressions.append(f"{name}: {before['queries']} -> {result['queries']} statements per request")
+        if result['p95_ms'] > before['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {before['p95_ms']} -> {result['p95_ms']} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vouchers', type=int, default=100, help='seeded vouchers of every type')
+    parser.add_argument('--accounts', type=int, default=100, help='seeded accounts')
+    parser.add_argument('--requests', type=int, default=20, help='requests per case')
+    parser.add_argument('--case', action='append', help='run only the named case (repeatable)')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='report regressions against the results saved in this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='p95 growth accepted by --compare')
+    args = parser.parse_args()
+
+    app.config['SQL_METRICS_HEADERS'] = True
+    with app.app_context():
+        seed(args.vouchers, args.accounts)
+    client = app.test_client()
+    # Drops the requests of the seeding, if any
+    client.get(API + '/sql-metrics?reset=1')
+
+    cases = Cases(args.vouchers).all()
+    names = args.case or list(cases)
+    print(f"{args.vouchers} vouchers, {args.accounts} accounts, {args.requests} requests per case")
+    print(f"{'case':<24} {'p50 ms':>9} {'p95 ms':>9} {'statements':>11} {'db ms':>8} {'rows':>8} {'errors':>7}")
+    results = {}
+    for name in names:
+        result = results[name] = run_case(client, cases[name], args.requests)
+        print(f"{name:<24} {result['p50_ms']:9.2f} {result['p95_ms']:9.2f} {result['queries']:11.1f} "
+              f"{result['db_ms']:8.2f} {result['rows']:8.1f} {result['errors']:7d}")
+
+    for name, result in results.items():
+        if result['first_error']:
+            print(f"\n{name} failed: {result['first_error']}")
+
+    stats = client.get(API + '/sql-metrics').get_json()
+    repeated = [(endpoint, endpoint_stats) for endpoint, endpoint_stats in stats['endpoints'].items()
+                if endpoint_stats['repeated_statement_requests']]
+    if repeated:
+        print("\nEndpoints running one statement many times with different parameters (N+1):")
+        for endpoint, endpoint_stats in repeated:
+            last = endpoint_stats['last_repeated']
+            print(f"  {endpoint}: {endpoint_stats['repeated_statement_requests']} of {endpoint_stats['requests']} requests, "
+                  f"{last['count']} times: {last['statement'][:160]}")
+
+    if args.save:
+        with open(args.save, 'w') as save_file:
+            json.dump(results, save_file, indent=2)
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        print("\nRegressions against " + args.compare + (":" if regressions else ": none"))
+        for regression in regressions:
+            print("  " + regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
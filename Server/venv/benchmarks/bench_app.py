@@ -0,0 +1,192 @@
+import datetime
+import functools
+import os
+import re
+import sqlite3
+import tempfile
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import DATE, DATETIME
+from sqlalchemy.sql.compiler import InsertmanyvaluesSentinelOpts
+
+# Offline harness: the Flask app runs against a local SQLite file with a second
+# database attached as `dbo`, so both `dbo.nt_1_...` and unqualified table names resolve.
+
+
+def _accept_iso_strings(sqlite_type):
+    # SQL Server converts ISO date strings implicitly and the controllers rely on it;
+    # SQLite's Date/DateTime only take Python objects, so strings are stored as sent.
+    base_bind_processor = sqlite_type.bind_processor
+
+    def bind_processor(self, dialect):
+        process = base_bind_processor(self, dialect)
+
+        def process_value(value):
+            if isinstance(value, str):
+                return value
+            return process(value)
+        return process_value
+
+    sqlite_type.bind_processor = bind_processor
+
+
+_accept_iso_strings(DATE)
+_accept_iso_strings(DATETIME)
+
+
+# SQL Server lets a join nest its right side without parentheses, closing the ON clauses
+# in reverse order ("a JOIN b JOIN c ON c1 ON c2" is "a JOIN (b JOIN c ON c1) ON c2");
+# SQLite only parses the parenthesised form, so the harness rewrites it.
+_JOIN_KEYWORD = re.compile(r'\b(?:(?:INNER|(?:LEFT|RIGHT|FULL)(?:\s+OUTER)?)\s+)?JOIN\b|\bON\b', re.IGNORECASE)
+_FROM_CLAUSE = re.compile(r'\bFROM\b(.*?)(?=\bWHERE\b|\bGROUP\s+BY\b|\bORDER\s+BY\b|\bHAVING\b|\bUNION\b|$)',
+                          re.IGNORECASE | re.DOTALL)
+
+
+def _masked(sql):
+    # Parenthesised parts and string literals blanked out, so that only the top level is matched
+    chars = list(sql)
+    depth = 0
+    quoted = False
+    for index, char in enumerate(sql):
+        if char == "'":
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+            continue
+        if quoted or depth:
+            chars[index] = ' '
+    return ''.join(chars)
+
+
+def _nested(node):
+    return not isinstance(node, str) and (not isinstance(node[2], str) or _nested(node[0]))
+
+
+def _render(node):
+    if isinstance(node, str):
+        return node
+    left, join, right, condition = node
+    right = _render(right) if isinstance(right, str) else '(' + _render(right) + ')'
+    return f"{_render(left)} {join} {right} ON {condition}"
+
+
+def _unnest_from(from_clause, masked):
+    stack = []
+    position = 0
+    pending = None
+    for match in _JOIN_KEYWORD.finditer(masked):
+        part = from_clause[position:match.start()].strip()
+        position = match.end()
+        if pending == 'ON':
+            right, join, left = stack.pop(), stack.pop(), stack.pop()
+            stack.append((left, join, right, part))
+        else:
+            stack.append(part)
+        keyword = ' '.join(match.group().split())
+        pending = 'ON' if keyword.upper() == 'ON' else None
+        if pending is None:
+            stack.append(keyword)
+    last = from_clause[position:].strip()
+    if pending == 'ON':
+        right, join, left = stack.pop(), stack.pop(), stack.pop()
+        stack.append((left, join, right, last))
+    else:
+        stack.append(last)
+    if len(stack) != 1 or not _nested(stack[0]):
+        return None
+    return _render(stack[0])
+
+
+@functools.lru_cache(maxsize=1024)
+def translate_sql_server(sql):
+    """Rewrite the SQL Server join nesting of a statement into the form SQLite parses."""
+    if not re.search(r'\bJOIN\b', sql, re.IGNORECASE):
+        return sql
+    masked = _masked(sql)
+    # Subqueries first, innermost outwards
+    parts = []
+    position = 0
+    depth = 0
+    for index, char in enumerate(masked):
+        if sql[index] == '(' and masked[index] == '(':
+            if depth == 0:
+                start = index
+            depth += 1
+        elif sql[index] == ')' and masked[index] == ')':
+            depth -= 1
+            if depth == 0:
+                parts.append(sql[position:start + 1])
+                parts.append(translate_sql_server(sql[start + 1:index]))
+                position = index
+    parts.append(sql[position:])
+    sql = ''.join(parts)
+    masked = _masked(sql)
+
+    match = _FROM_CLAUSE.search(masked)
+    if match is None:
+        return sql
+    try:
+        from_clause = _unnest_from(sql[match.start(1):match.end(1)], match.group(1))
+    except IndexError:
+        from_clause = None
+    if from_clause is None:
+        return sql
+    return sql[:match.start(1)] + ' ' + from_clause + ' ' + sql[match.end(1):]
+
+
+def _sql_server_convert(sql_type, value, style=None):
+    # CONVERT(varchar(10), date, 103) formats dd/mm/yyyy; other conversions keep the value
+    if value is not None and style == 103:
+        return '/'.join(reversed(str(value)[:10].split('-')))
+    return value
+
+
+def _date(value):
+    # Dates are stored as ISO strings, sometimes with a time part
+    return datetime.date.fromisoformat(value[:10].decode())
+
+
+sqlite3.register_converter('DATE', _date)
+
+
+def create_bench_app():
+    work_dir = tempfile.mkdtemp(prefix='sugarian-bench-')
+    os.environ.setdefault('API_URL', '/api/sugarian')
+    os.environ['UPLOAD_FOLDER'] = os.path.join(work_dir, 'uploads')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(work_dir, 'main.db')
+    dbo_path = os.path.join(work_dir, 'dbo.db')
+
+    from app import app, db
+
+    with app.app_context():
+        # SQL Server sends a batch of inserts whose generated ids are needed in parameter order as one
+        # INSERT ... SELECT ... ORDER BY; SQLite numbers the rows of one multi-row INSERT in order too,
+        # so the harness batches them the same way instead of one INSERT per row
+        db.engine.dialect.insertmanyvalues_implicit_sentinel = InsertmanyvaluesSentinelOpts.ANY_AUTOINCREMENT
+
+        # DATE columns come back as date objects, as pymssql returns them, also from raw SQL
+        db.engine.dialect.native_datetime = True
+
+        @event.listens_for(db.engine, 'do_connect')
+        def parse_declared_types(dialect, connection_record, cargs, cparams):
+            cparams['detect_types'] = sqlite3.PARSE_DECLTYPES
+
+        @event.listens_for(db.engine, 'connect')
+        def attach_dbo(dbapi_connection, connection_record):
+            dbapi_connection.execute(f"ATTACH DATABASE '{dbo_path}' AS dbo")
+            # CONVERT(varchar(10), ...) parses as two function calls
+            dbapi_connection.create_function('varchar', 1, lambda length: None, deterministic=True)
+            dbapi_connection.create_function('CONVERT', 2, _sql_server_convert, deterministic=True)
+            dbapi_connection.create_function('CONVERT', 3, _sql_server_convert, deterministic=True)
+
+        @event.listens_for(db.engine, 'before_cursor_execute', retval=True)
+        def translate(conn, cursor, statement, parameters, context, executemany):
+            return translate_sql_server(statement), parameters
+
+        db.engine.dispose()
+
+        with db.engine.begin() as connection:
+            db.metadata.create_all(connection.execution_options(schema_translate_map={None: 'dbo'}))
+
+    return app, db
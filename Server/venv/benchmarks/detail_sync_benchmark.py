@@ -0,0 +1,141 @@
+"""Round trips and latency of voucher detail saves with DetailSync against the previous per-row loop.
+
+Every voucher is saved twice: first with all its rows added, then edited with half of the rows
+updated, a quarter deleted and a quarter added. The SQLite harness answers in microseconds, so
+--round-trip-ms adds the network time of one statement to SQL Server. Run from the Server/venv
+directory:
+
+    python -m benchmarks.detail_sync_benchmark --vouchers 20 --sizes 5 20 50 100 --round-trip-ms 1
+"""
+import argparse
+import functools
+import statistics
+import time
+from sqlalchemy import event
+from benchmarks.bench_app import create_bench_app
+
+app, db = create_bench_app()
+
+from app.models.Outword.SaleBill.SaleBillModels import SaleBillHead, SaleBillDetail
+from app.Controllers.Outword.SaleBill.SaleBillController import sale_bill_details
+
+statements = [0]
+round_trip = [0.0]
+
+
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    statements[0] += 1
+    if round_trip[0]:
+        time.sleep(round_trip[0])
+
+
+def make_row(index, doc_no):
+    return {
+        'doc_no': doc_no, 'detail_id': index, 'Tran_Type': 'SB', 'item_code': 1, 'ic': 1, 'narration': f'row {index}',
+        'Quantal': 10 + index, 'packing': 50, 'bags': 20, 'rate': 3500, 'item_Amount': 35000 + index,
+        'Company_Code': 1, 'Year_Code': 1, 'Branch_Code': 1, 'Brand_Code': 0
+    }
+
+
+def edit_rows(detail_ids, size, doc_no):
+    # Half updated (two different column sets), a quarter deleted, a quarter added
+    updates, deletes = detail_ids[:size // 2], detail_ids[size // 2:size // 2 + size // 4]
+    rows = []
+    for position, saledetailid in enumerate(updates):
+        if position % 2:
+            rows.append({'rowaction': 'update', 'saledetailid': saledetailid, 'rate': 3600, 'item_Amount': 36000})
+        else:
+            rows.append({'rowaction': 'update', 'saledetailid': saledetailid, 'narration': 'edited'})
+    rows += [{'rowaction': 'delete', 'saledetailid': saledetailid} for saledetailid in deletes]
+    rows += [dict(make_row(size + index, doc_no), rowaction='add') for index in range(size // 4)]
+    return rows
+
+
+def legacy_save(head, rows, flush_per_row=False):
+    # The loop the head/detail controllers used before DetailSync; some flushed after every row
+    createdDetails, updatedDetails, deletedDetailIds = [], [], []
+    for item in rows:
+        item = dict(item)
+        if item['rowaction'] == "add":
+            del item['rowaction']
+            new_detail = SaleBillDetail(**item)
+            head.details.append(new_detail)
+            createdDetails.append(new_detail)
+
+        elif item['rowaction'] == "update":
+            saledetailid = item['saledetailid']
+            update_values = {k: v for k, v in item.items() if k not in ('saledetailid', 'rowaction', 'saleid')}
+            db.session.query(SaleBillDetail).filter(SaleBillDetail.saledetailid == saledetailid).update(update_values)
+            updatedDetails.append(saledetailid)
+
+        elif item['rowaction'] == "delete":
+            saledetailid = item['saledetailid']
+            detail_to_delete = db.session.query(SaleBillDetail).filter(SaleBillDetail.saledetailid == saledetailid).one_or_none()
+            if detail_to_delete:
+                db.session.delete(detail_to_delete)
+                deletedDetailIds.append(saledetailid)
+        if flush_per_row:
+            db.session.flush()
+    db.session.flush()
+    return [detail.saledetailid for detail in createdDetails]
+
+
+def detail_sync_save(head, rows):
+    changes = sale_bill_details.apply(rows, add_values={'saleid': head.saleid})
+    return [detail.saledetailid for detail in changes.added]
+
+
+def save_voucher(save, doc_no, size):
+    # Returns (statements, seconds) of the first save and of the edit
+    results = []
+    head = SaleBillHead(doc_no=doc_no, Company_Code=1, Year_Code=1, Tran_Type='SB')
+    db.session.add(head)
+    db.session.flush()
+    detail_ids = []
+    for rows in ([dict(make_row(index, doc_no), rowaction='add') for index in range(size)], None):
+        if rows is None:
+            rows = edit_rows(detail_ids, size, doc_no)
+        statements[0] = 0
+        started = time.perf_counter()
+        detail_ids = save(head, rows) + detail_ids
+        db.session.commit()
+        results.append((statements[0], time.perf_counter() - started))
+    return results
+
+
+def run(label, save, sizes, vouchers, first_doc_no):
+    doc_no = first_doc_no
+    for size in sizes:
+        first, edit = [], []
+        for _ in range(vouchers):
+            doc_no += 1
+            first_save, edit_save = save_voucher(save, doc_no, size)
+            first.append(first_save)
+            edit.append(edit_save)
+        for step, results in (('save', first), ('edit', edit)):
+            counts = [count for count, _ in results]
+            times = sorted(seconds * 1000 for _, seconds in results)
+            p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+            print(f"{label:<12} {size:5d} rows {step:<5} {statistics.mean(counts):8.1f} statements "
+                  f"{statistics.median(times):9.2f} ms p50 {p95:9.2f} ms p95")
+    return doc_no
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vouchers', type=int, default=20, help='vouchers saved per size')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5, 20, 50, 100], help='detail rows per voucher')
+    parser.add_argument('--round-trip-ms', type=float, default=1.0, help='network time added to every statement')
+    args = parser.parse_args()
+    round_trip[0] = args.round_trip_ms / 1000
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', count_statement)
+        print(f"{args.vouchers} vouchers per size, {args.round_trip_ms} ms per round trip")
+        doc_no = run('legacy', legacy_save, args.sizes, args.vouchers, 0)
+        doc_no = run('legacy flush', functools.partial(legacy_save, flush_per_row=True), args.sizes, args.vouchers, doc_no)
+        run('DetailSync', detail_sync_save, args.sizes, args.vouchers, doc_no)
+
+
+if __name__ == '__main__':
+    main()
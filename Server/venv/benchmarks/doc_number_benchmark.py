@@ -0,0 +1,85 @@
+"""Concurrent saves numbered by the document number counters against the previous MAX(doc_no) + 1.
+
+Every thread saves Letter documents in its own session; afterwards the numbers are checked
+for duplicates and gaps. Run from the Server/venv directory:
+
+    python -m benchmarks.doc_number_benchmark --threads 8 --saves 50 --block 5
+"""
+import argparse
+import threading
+import time
+from collections import Counter
+from benchmarks.bench_app import create_bench_app
+
+app, db = create_bench_app()
+
+from sqlalchemy import func
+from app.models.BusinessReleted.Letter.LetterModels import Letter
+from app.Controllers.BusinessRelated.Letter.LetterController import letter_numbers
+
+
+def legacy_numbers(company_code, year_code, count):
+    # What the insert controllers did before the counters (one document per save)
+    max_doc_no = db.session.query(func.max(Letter.DOC_NO)).filter_by(Company_Code=company_code, Year_Code=year_code).scalar() or 0
+    return int(max_doc_no) + 1
+
+
+def counter_numbers(company_code, year_code, count):
+    return letter_numbers.reserve(company_code, year_code, count=count)
+
+
+def save_letters(allocate, company_code, year_code, block):
+    first_no = allocate(company_code, year_code, block)
+    for doc_no in range(first_no, first_no + block):
+        db.session.add(Letter(DOC_NO=doc_no, Company_Code=company_code, Year_Code=year_code, SUBJECT='bench'))
+    db.session.commit()
+
+
+def run(label, allocate, company_code, threads, saves, block):
+    errors = []
+    start_barrier = threading.Barrier(threads)
+
+    def worker():
+        with app.app_context():
+            start_barrier.wait()
+            for _ in range(saves):
+                try:
+                    save_letters(allocate, company_code, 1, block)
+                except Exception as e:
+                    db.session.rollback()
+                    errors.append(type(e).__name__)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    with app.app_context():
+        numbers = [int(doc_no) for (doc_no,) in db.session.query(Letter.DOC_NO).filter_by(Company_Code=company_code, Year_Code=1).all()]
+    duplicates = sum(count - 1 for count in Counter(numbers).values() if count > 1)
+    gaps = (max(numbers) - len(set(numbers))) if numbers else 0
+    print(f"{label:<22} {len(numbers) / elapsed:10.1f} documents/s {len(numbers):6d} saved "
+          f"{duplicates:5d} duplicates {gaps:5d} gaps {len(errors):5d} failed saves")
+    return duplicates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--saves', type=int, default=50)
+    parser.add_argument('--block', type=int, default=5, help='documents numbered per reservation')
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads x {args.saves} saves x {args.block} documents")
+    run('legacy: MAX(doc_no)+1', legacy_numbers, 1, args.threads, args.saves, 1)
+    duplicates = run('counter: next()', counter_numbers, 2, args.threads, args.saves, 1)
+    duplicates += run('counter: reserve(block)', counter_numbers, 3, args.threads, args.saves, args.block)
+    if duplicates:
+        raise SystemExit("the counters issued duplicate numbers")
+
+
+if __name__ == '__main__':
+    main()
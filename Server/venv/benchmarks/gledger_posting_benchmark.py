@@ -0,0 +1,88 @@
+"""Postings per second of the GLedger posting engine against the previous replace path.
+
+Run from the Server/venv directory:
+
+    python -m benchmarks.gledger_posting_benchmark --documents 200 --rows 8
+"""
+import argparse
+import time
+from datetime import date
+from benchmarks.bench_app import create_bench_app
+
+app, db = create_bench_app()
+
+from app.models.Reports.GLedeger.GLedgerModels import Gledger
+from app.utils.GLedgerPosting import post_gledger_entries
+
+
+def make_entries(doc_no, rows, revision):
+    entries = []
+    for order_code in range(rows // 2):
+        # Each revision changes the amount of the first pair only
+        amount = 1000 + order_code + (revision if order_code == 0 else 0)
+        for drcr, ac_code in (('D', 100 + order_code), ('C', 200 + order_code)):
+            entries.append({
+                "CASHCREDIT": "", "DOC_DATE": "2024-04-01", "AC_CODE": ac_code, "UNIT_Code": 0,
+                "NARRATION": f"Doc {doc_no}", "AMOUNT": amount, "TENDER_ID": 0, "TENDER_ID_DETAIL": 0,
+                "VOUCHER_ID": 0, "ORDER_CODE": len(entries) + 1, "DRCR": drcr, "DRCR_HEAD": 0,
+                "ADJUSTED_AMOUNT": 0, "Branch_Code": 1, "SORT_TYPE": "SB", "SORT_NO": doc_no,
+                "ac": ac_code, "vc": 0, "progid": 0, "tranid": 0, "saleid": doc_no
+            })
+    return entries
+
+
+def legacy_post(company_code, doc_no, year_code, tran_type, entries):
+    # The algorithm create-Record-gLedger used before the posting engine (without its HTTP hop)
+    existing_records = Gledger.query.filter_by(COMPANY_CODE=company_code, DOC_NO=doc_no, YEAR_CODE=year_code, TRAN_TYPE=tran_type).all()
+    for record in existing_records:
+        db.session.delete(record)
+    db.session.commit()
+
+    new_records = []
+    for record_data in entries:
+        record_data = dict(record_data, COMPANY_CODE=company_code, DOC_NO=doc_no, YEAR_CODE=year_code, TRAN_TYPE=tran_type)
+        # SQL Server converted the ISO string itself; SQLite needs a date
+        record_data['DOC_DATE'] = date.fromisoformat(record_data['DOC_DATE'])
+        new_records.append(Gledger(**record_data))
+    db.session.add_all(new_records)
+    db.session.commit()
+
+
+def engine_post(company_code, doc_no, year_code, tran_type, entries):
+    post_gledger_entries(company_code, doc_no, year_code, tran_type, entries)
+    db.session.commit()
+
+
+def engine_insert(company_code, doc_no, year_code, tran_type, entries):
+    # The insert controllers: the document number was just reserved
+    post_gledger_entries(company_code, doc_no, year_code, tran_type, entries, new_document=True)
+    db.session.commit()
+
+
+def run(label, post, tran_type, documents, rows, revision):
+    started = time.perf_counter()
+    for doc_no in range(1, documents + 1):
+        post(1, doc_no, 1, tran_type, make_entries(doc_no, rows, revision))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {documents / elapsed:10.1f} postings/s {documents * rows / elapsed:10.1f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--documents', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=8)
+    args = parser.parse_args()
+
+    with app.app_context():
+        print(f"{args.documents} documents x {args.rows} GLedger rows")
+        run('legacy: first save', legacy_post, 'L', args.documents, args.rows, 0)
+        run('legacy: re-save one change', legacy_post, 'L', args.documents, args.rows, 1)
+        run('legacy: re-save unchanged', legacy_post, 'L', args.documents, args.rows, 1)
+        run('engine: first save', engine_post, 'E', args.documents, args.rows, 0)
+        run('engine: first save (insert path)', engine_insert, 'N', args.documents, args.rows, 0)
+        run('engine: re-save one change', engine_post, 'E', args.documents, args.rows, 1)
+        run('engine: re-save unchanged', engine_post, 'E', args.documents, args.rows, 1)
+
+
+if __name__ == '__main__':
+    main()